@@ -28,8 +28,17 @@ except ImportError as e:
 import json
 import os
 import tempfile
+from functools import lru_cache
 from typing import Any, Dict
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # OpenAI import for patching/testing
 try:
     from openai import OpenAI
@@ -44,14 +53,45 @@ except ImportError:
     print("python-dotenv not installed, using system environment variables")
 
 # Import refactored services
-from services.ai_service import AIService, AIProviderError, OPENAI_AVAILABLE
+from services.ai_service import AIService, AIProviderError, OPENAI_AVAILABLE, _PARSE_SYSTEM_MESSAGE
 from services.resume_service import ResumeService
 from services.scoring_service import ScoringService
 from validation.validators import ResumeValidator, JobDescriptionValidator
 
+if FLASK_AVAILABLE and orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider that encodes and decodes with orjson"""
+
+        # Datetimes and dataclasses go through Flask's default() so responses
+        # keep the same format as the stdlib provider
+        _OPTIONS = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            option = self._OPTIONS
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=self.default, option=option).decode()
+            except TypeError:
+                # orjson rejects what the stdlib accepts, e.g. ints beyond 64 bits
+                return super().dumps(obj, **kwargs)
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
 # Initialize Flask app
 if FLASK_AVAILABLE:
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
     CORS(app)
 
 
@@ -64,13 +104,54 @@ def validate_resume_structure(resume_data: Dict[str, Any]) -> Dict[str, Any]:
 def _strip_json_content(content: str) -> str:
     """Remove optional markdown fences from AI responses."""
     cleaned = content.strip()
-    if cleaned.startswith("```json"):
-        cleaned = cleaned[7:]
-    if cleaned.startswith("```"):
-        cleaned = cleaned[3:]
-    if cleaned.endswith("```"):
-        cleaned = cleaned[:-3]
-    return cleaned.strip()
+
+    # Find the fence bounds first so the payload is sliced only once
+    start = 7 if cleaned.startswith("```json") else 0
+    if cleaned.startswith("```", start):
+        start += 3
+    end = len(cleaned)
+    if end - start >= 3 and cleaned.endswith("```"):
+        end -= 3
+    return cleaned[start:end].strip()
+
+
+@lru_cache(maxsize=4)
+def _get_openai_client(client_class: Any, api_key: str) -> Any:
+    """
+    Create the OpenAI client for an API key
+
+    Clients are cached so requests share one client and its HTTP connection
+    pool. The class is part of the key so a patched app.OpenAI gets its own.
+    """
+    return client_class(api_key=api_key)
+
+
+@lru_cache(maxsize=128)
+def _parse_resume_via_openai(client_class: Any, api_key: str, model: str, text_resume: str) -> str:
+    """
+    Return the AI's JSON for a resume, cached per client class, key, model and text
+
+    Only responses that parse are cached; callers load the returned string so
+    each request gets its own dict. The client is looked up on each miss, so
+    the cache never holds a client _get_openai_client has evicted. Like that
+    cache, entries hold the API key, and they also hold resume text (PII),
+    for the life of the process; they are bounded at 128 and
+    _parse_resume_via_openai.cache_clear() drops them.
+    """
+    client = _get_openai_client(client_class, api_key)
+    response = client.chat.completions.create(
+        model=model,
+        messages=(
+            _PARSE_SYSTEM_MESSAGE,
+            {"role": "user", "content": f"Convert this resume to JSON:\n\n{text_resume}"}
+        ),
+        temperature=0.1,
+        max_tokens=4000
+    )
+
+    json_content = _strip_json_content(response.choices[0].message.content)
+    _json_loads(json_content)
+    return json_content
 
 
 # =============================================================================
@@ -201,8 +282,8 @@ if FLASK_AVAILABLE:
         """Get sample resume template"""
         try:
             # Load the existing resume as a template
-            with open('david_resume_json.json', 'r') as f:
-                sample_data = json.load(f)
+            with open('david_resume_json.json', 'rb') as f:
+                sample_data = _json_loads(f.read())
 
             # Anonymize the sample data
             sample_data['personal'] = {
@@ -250,19 +331,13 @@ if FLASK_AVAILABLE:
             return jsonify({'error': 'OpenAI API key not configured'}), 500
 
         try:
-            client = OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-                messages=[
-                    {"role": "system", "content": AIService.get_parsing_system_prompt()},
-                    {"role": "user", "content": f"Convert this resume to JSON:\n\n{text_resume.strip()}"}
-                ],
-                temperature=0.1,
-                max_tokens=4000
+            json_content = _parse_resume_via_openai(
+                OpenAI,
+                api_key,
+                os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+                text_resume.strip()
             )
-
-            json_content = _strip_json_content(response.choices[0].message.content)
-            parsed_resume = json.loads(json_content)
+            parsed_resume = _json_loads(json_content)
 
         except json.JSONDecodeError as e:
             return jsonify({'error': f'Failed to parse AI response as JSON: {str(e)}'}), 500
@@ -3,18 +3,22 @@ Health Check Routes - System health and status monitoring
 """
 
 import datetime
-import subprocess
-import platform
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
+# Heavy modules (platform, psutil, openai via services) are imported inside
+# the functions that need them so importing this module stays cheap.
 
-from services.ai_service import OPENAI_AVAILABLE, AIService
+
+@lru_cache(maxsize=None)
+def _load_psutil():
+    """Import psutil on first use, returning None if it is not installed"""
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        return None
 
 
 def get_health_status() -> Dict[str, Any]:
@@ -24,9 +28,10 @@ def get_health_status() -> Dict[str, Any]:
     Returns:
         Dictionary with health check information
     """
+    now = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
     health_data = {
         'status': 'healthy',
-        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z',
+        'timestamp': now,
         'version': '1.0.0',
         'message': 'Resume Optimizer API is running'
     }
@@ -36,7 +41,7 @@ def get_health_status() -> Dict[str, Any]:
     health_data['dependencies'] = _check_dependencies()
     health_data['files'] = _check_critical_files()
     health_data['environment'] = _get_environment_config()
-    health_data['ai_provider'] = _check_ai_provider()
+    health_data['ai_provider'] = _check_ai_provider(now=now)
     health_data['features'] = _get_feature_availability(health_data)
 
     # Overall health assessment
@@ -55,12 +60,15 @@ def get_health_status() -> Dict[str, Any]:
 
 def _get_system_info() -> Dict[str, Any]:
     """Get system information"""
+    import platform
+
+    psutil = _load_psutil()
     system_info = {
         'platform': platform.platform(),
         'python_version': platform.python_version()
     }
 
-    if PSUTIL_AVAILABLE:
+    if psutil is not None:
         try:
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
@@ -86,53 +94,26 @@ def _get_system_info() -> Dict[str, Any]:
 
 def _check_dependencies() -> Dict[str, bool]:
     """Check availability of required dependencies"""
+    from services.ai_service import OPENAI_AVAILABLE
+    from services.probes import DOTENV_AVAILABLE, PDFKIT_AVAILABLE
+
     dependencies = {
         'flask': True,  # Already imported if we're here
         'openai': OPENAI_AVAILABLE,
-        'pdfkit': _check_pdfkit_available(),
+        'pdfkit': PDFKIT_AVAILABLE,
         'wkhtmltopdf': _check_wkhtmltopdf(),
-        'psutil': PSUTIL_AVAILABLE,
-        'dotenv': _check_dotenv_available()
+        'psutil': _load_psutil() is not None,
+        'dotenv': DOTENV_AVAILABLE
     }
 
     return dependencies
 
 
-def _check_pdfkit_available() -> bool:
-    """Check if pdfkit is available"""
-    try:
-        import pdfkit
-        return True
-    except ImportError:
-        return False
-
-
 def _check_wkhtmltopdf() -> bool:
-    """Check if wkhtmltopdf binary is available"""
-    paths = ['wkhtmltopdf', '/usr/bin/wkhtmltopdf', '/usr/local/bin/wkhtmltopdf']
-
-    for path in paths:
-        try:
-            subprocess.run(
-                [path, '--version'],
-                capture_output=True,
-                check=True,
-                timeout=5
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            continue
+    """Check if wkhtmltopdf binary is available (probed once at startup)"""
+    from services.probes import WKHTMLTOPDF_PATH
 
-    return False
-
-
-def _check_dotenv_available() -> bool:
-    """Check if python-dotenv is available"""
-    try:
-        import dotenv
-        return True
-    except ImportError:
-        return False
+    return WKHTMLTOPDF_PATH is not None
 
 
 def _check_critical_files() -> Dict[str, Dict[str, Any]]:
@@ -143,26 +124,34 @@ def _check_critical_files() -> Dict[str, Dict[str, Any]]:
         '.env'
     ]
 
-    file_checks = {}
+    critical = set(critical_files)
+    found = {}
 
-    for file_path in critical_files:
-        try:
-            if os.path.exists(file_path):
-                stat_info = os.stat(file_path)
-                file_checks[file_path] = {
-                    'exists': True,
-                    'readable': os.access(file_path, os.R_OK),
-                    'size_bytes': stat_info.st_size,
-                    'last_modified': datetime.datetime.fromtimestamp(
-                        stat_info.st_mtime
-                    ).isoformat()
-                }
-            else:
-                file_checks[file_path] = {'exists': False}
-        except Exception as e:
-            file_checks[file_path] = {'error': str(e)}
+    # One directory scan instead of exists/stat calls per file
+    try:
+        with os.scandir('.') as entries:
+            for entry in entries:
+                if entry.name not in critical:
+                    continue
+                try:
+                    stat_info = entry.stat()
+                    found[entry.name] = {
+                        'exists': True,
+                        'readable': os.access(entry.path, os.R_OK),
+                        'size_bytes': stat_info.st_size,
+                        'last_modified': datetime.datetime.fromtimestamp(
+                            stat_info.st_mtime
+                        ).isoformat()
+                    }
+                except OSError as e:
+                    found[entry.name] = {'error': str(e)}
+    except OSError as e:
+        return {file_path: {'error': str(e)} for file_path in critical_files}
 
-    return file_checks
+    return {
+        file_path: found.get(file_path, {'exists': False})
+        for file_path in critical_files
+    }
 
 
 def _get_environment_config() -> Dict[str, Any]:
@@ -177,8 +166,15 @@ def _get_environment_config() -> Dict[str, Any]:
     }
 
 
-def _check_ai_provider() -> Dict[str, Any]:
-    """Check AI provider configuration and connectivity"""
+def _check_ai_provider(now: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Check AI provider configuration and connectivity
+
+    Args:
+        now: RFC 3339 timestamp of the current health check, reused for last_test
+    """
+    from services.ai_service import OPENAI_AVAILABLE, AIService
+
     ai_provider = os.getenv('AI_PROVIDER', 'local').lower()
     ai_status = {
         'provider': ai_provider,
@@ -203,7 +199,9 @@ def _check_ai_provider() -> Dict[str, Any]:
         if not test_result['success']:
             ai_status['connectivity_error'] = test_result.get('error', 'Unknown error')
         else:
-            ai_status['last_test'] = datetime.datetime.utcnow().isoformat() + 'Z'
+            ai_status['last_test'] = now or datetime.datetime.now(
+                datetime.timezone.utc
+            ).isoformat(timespec='seconds')
 
     except Exception as e:
         ai_status['error'] = str(e)
@@ -216,7 +214,7 @@ def _get_feature_availability(health_data: Dict[str, Any]) -> Dict[str, bool]:
     dependencies = health_data.get('dependencies', {})
     ai_status = health_data.get('ai_provider', {})
     files = health_data.get('files', {})
-    text_to_json_available = OPENAI_AVAILABLE and ai_status.get('configured', False)
+    text_to_json_available = dependencies.get('openai', False) and ai_status.get('configured', False)
 
     return {
         'resume_optimization': True,
@@ -250,7 +248,7 @@ def _assess_health_issues(health_data: Dict[str, Any]) -> Dict[str, list]:
     if not dependencies.get('wkhtmltopdf'):
         warnings.append('wkhtmltopdf not available - PDF export disabled')
 
-    if not PSUTIL_AVAILABLE:
+    if not dependencies.get('psutil'):
         warnings.append('psutil not available - system monitoring limited')
 
     if not ai_status.get('connectivity_test'):
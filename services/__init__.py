@@ -3,7 +3,16 @@ Services package for Resume Optimizer
 """
 
 from .ai_service import AIService
+from .probes import DOTENV_AVAILABLE, PDFKIT_AVAILABLE, WKHTMLTOPDF_PATH
 from .resume_service import ResumeService
-from .scoring_service import ScoringService
+from .scoring_service import ScoringContext, ScoringService
 
-__all__ = ['AIService', 'ResumeService', 'ScoringService']
+__all__ = [
+    'AIService',
+    'ResumeService',
+    'ScoringService',
+    'ScoringContext',
+    'DOTENV_AVAILABLE',
+    'PDFKIT_AVAILABLE',
+    'WKHTMLTOPDF_PATH'
+]
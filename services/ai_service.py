@@ -2,117 +2,30 @@
 AI Service - Handles AI provider configuration and text-to-JSON conversion
 """
 
+import asyncio
 import json
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     OpenAI = None
+    AsyncOpenAI = None
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-class AIProviderError(Exception):
-    """Raised when AI provider is not available or misconfigured"""
-    pass
-
-
-class AIService:
-    """Service for managing AI provider interactions"""
-
-    def __init__(self):
-        """Initialize AI service with environment configuration"""
-        if not OPENAI_AVAILABLE:
-            raise AIProviderError("OpenAI package not available. Install with: pip install openai")
-
-        self.provider = os.getenv('AI_PROVIDER', 'local').lower()
-        self.client = self._initialize_client()
-        self.model_name = self._get_model_name()
-
-    def _initialize_client(self) -> OpenAI:
-        """Initialize the appropriate AI client based on configuration"""
-        if self.provider == 'openai':
-            api_key = os.getenv('OPENAI_API_KEY')
-            if not api_key:
-                raise AIProviderError(
-                    'OpenAI API key not configured. Set OPENAI_API_KEY environment variable.'
-                )
-            return OpenAI(api_key=api_key)
-        else:
-            # Local LLM configuration (default)
-            base_url = os.getenv('LOCAL_LLM_BASE_URL', 'http://172.28.144.1:1234/v1')
-            return OpenAI(
-                api_key="local-key",  # Local LLM doesn't require real API key
-                base_url=base_url
-            )
-
-    def _get_model_name(self) -> str:
-        """Get the model name based on provider"""
-        if self.provider == 'openai':
-            return os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
-        else:
-            return os.getenv('LOCAL_MODEL_NAME', 'local-model')
-
-    def parse_resume_text(self, text_resume: str) -> Dict[str, Any]:
-        """
-        Convert text resume to structured JSON format
-
-        Args:
-            text_resume: Raw text resume content
-
-        Returns:
-            Parsed resume data as dictionary
-
-        Raises:
-            AIProviderError: If parsing fails
-            ValueError: If input is invalid
-        """
-        if not text_resume or not text_resume.strip():
-            raise ValueError("Text resume cannot be empty")
-
-        system_prompt = self.get_parsing_system_prompt()
-        user_prompt = f"Convert this resume to JSON:\n\n{text_resume}"
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,  # Low temperature for consistent formatting
-                max_tokens=4000
-            )
-
-            json_content = self.extract_json_from_response(response)
-            parsed_resume = json.loads(json_content)
-
-            return parsed_resume
-
-        except json.JSONDecodeError as e:
-            raise AIProviderError(f"Failed to parse AI response as JSON: {str(e)}")
-        except Exception as e:
-            raise AIProviderError(f"Resume parsing failed: {str(e)}")
-
-    @staticmethod
-    def extract_json_from_response(response) -> str:
-        """Extract and clean JSON from AI response"""
-        json_content = response.choices[0].message.content.strip()
-
-        # Remove markdown formatting if present
-        if json_content.startswith('```json'):
-            json_content = json_content[7:]
-        if json_content.endswith('```'):
-            json_content = json_content[:-3]
-
-        return json_content.strip()
 
-    @staticmethod
-    def get_parsing_system_prompt() -> str:
-        """Get the system prompt for resume parsing"""
-        return """You are a resume parsing expert. Convert the provided text resume into a structured JSON format exactly matching this schema:
+# System prompt for resume parsing, built once at import
+_PARSE_SYSTEM_PROMPT = """You are a resume parsing expert. Convert the provided text resume into a structured JSON format exactly matching this schema:
 
 {
   "personal": {
@@ -184,6 +97,201 @@ Instructions:
 
 Return ONLY the JSON structure, no additional text."""
 
+# Shared system message for every parse request; treat as read-only
+_PARSE_SYSTEM_MESSAGE = {"role": "system", "content": _PARSE_SYSTEM_PROMPT}
+
+
+class AIProviderError(Exception):
+    """Raised when AI provider is not available or misconfigured"""
+    pass
+
+
+@lru_cache(maxsize=4)
+def _initialize_client(provider: str, api_key: Optional[str], base_url: Optional[str]) -> OpenAI:
+    """
+    Create the AI client for a provider configuration
+
+    Clients are cached per configuration so every AIService instance shares
+    one client and its HTTP connection pool.
+    """
+    if provider == 'openai':
+        if not api_key:
+            raise AIProviderError(
+                'OpenAI API key not configured. Set OPENAI_API_KEY environment variable.'
+            )
+        return OpenAI(api_key=api_key)
+    else:
+        # Local LLM configuration (default)
+        return OpenAI(
+            api_key="local-key",  # Local LLM doesn't require real API key
+            base_url=base_url
+        )
+
+
+def _get_model_name(provider: str) -> str:
+    """Get the model name based on provider"""
+    if provider == 'openai':
+        return os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+    else:
+        return os.getenv('LOCAL_MODEL_NAME', 'local-model')
+
+
+class AIService:
+    """Service for managing AI provider interactions"""
+
+    __slots__ = ('provider', 'client', 'model_name')
+
+    def __init__(self):
+        """Initialize AI service with environment configuration"""
+        if not OPENAI_AVAILABLE:
+            raise AIProviderError("OpenAI package not available. Install with: pip install openai")
+
+        self.provider = os.getenv('AI_PROVIDER', 'local').lower()
+        if self.provider == 'openai':
+            self.client = _initialize_client(self.provider, os.getenv('OPENAI_API_KEY'), None)
+        else:
+            self.client = _initialize_client(
+                self.provider,
+                None,
+                os.getenv('LOCAL_LLM_BASE_URL', 'http://172.28.144.1:1234/v1')
+            )
+        self.model_name = _get_model_name(self.provider)
+
+    def parse_resume_text(self, text_resume: str) -> Dict[str, Any]:
+        """
+        Convert text resume to structured JSON format
+
+        Args:
+            text_resume: Raw text resume content
+
+        Returns:
+            Parsed resume data as dictionary
+
+        Raises:
+            AIProviderError: If parsing fails
+            ValueError: If input is invalid
+        """
+        if not text_resume or not text_resume.strip():
+            raise ValueError("Text resume cannot be empty")
+
+        user_prompt = f"Convert this resume to JSON:\n\n{text_resume}"
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=(
+                    _PARSE_SYSTEM_MESSAGE,
+                    {"role": "user", "content": user_prompt}
+                ),
+                temperature=0.1,  # Low temperature for consistent formatting
+                max_tokens=4000
+            )
+
+            json_content = self.extract_json_from_response(response)
+            parsed_resume = _json_loads(json_content)
+
+            return parsed_resume
+
+        except json.JSONDecodeError as e:
+            raise AIProviderError(f"Failed to parse AI response as JSON: {str(e)}")
+        except Exception as e:
+            raise AIProviderError(f"Resume parsing failed: {str(e)}")
+
+    def parse_resumes_batch(
+        self,
+        text_resumes: List[str],
+        max_concurrency: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert several text resumes to structured JSON concurrently
+
+        Requests share one async client and run in parallel, limited to
+        max_concurrency in flight at a time. This starts its own event loop
+        with asyncio.run, so it cannot be called while a loop is running;
+        await parse_resumes_batch_async there instead.
+
+        Args:
+            text_resumes: Raw text resume contents
+            max_concurrency: Maximum number of simultaneous provider requests
+
+        Returns:
+            Parsed resume data, in the same order as text_resumes
+
+        Raises:
+            AIProviderError: If any parse fails
+            ValueError: If any input is invalid or max_concurrency < 1
+        """
+        return asyncio.run(self.parse_resumes_batch_async(text_resumes, max_concurrency))
+
+    async def parse_resumes_batch_async(
+        self,
+        text_resumes: List[str],
+        max_concurrency: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Coroutine form of parse_resumes_batch for callers already in an event loop"""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        for text_resume in text_resumes:
+            if not text_resume or not text_resume.strip():
+                raise ValueError("Text resume cannot be empty")
+
+        if not text_resumes:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with AsyncOpenAI(
+            api_key=self.client.api_key,
+            base_url=self.client.base_url
+        ) as client:
+
+            async def parse_one(text_resume: str) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        response = await client.chat.completions.create(
+                            model=self.model_name,
+                            messages=(
+                                _PARSE_SYSTEM_MESSAGE,
+                                {"role": "user", "content": f"Convert this resume to JSON:\n\n{text_resume}"}
+                            ),
+                            temperature=0.1,
+                            max_tokens=4000
+                        )
+                        return _json_loads(self.extract_json_from_response(response))
+                    except json.JSONDecodeError as e:
+                        raise AIProviderError(f"Failed to parse AI response as JSON: {str(e)}")
+                    except Exception as e:
+                        raise AIProviderError(f"Resume parsing failed: {str(e)}")
+
+            results = await asyncio.gather(
+                *(parse_one(text) for text in text_resumes),
+                return_exceptions=True
+            )
+
+        # Every request has finished before the client closed; raise the
+        # first failure in input order
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    @staticmethod
+    def extract_json_from_response(response) -> str:
+        """Extract and clean JSON from AI response"""
+        json_content = response.choices[0].message.content.strip()
+
+        # Remove markdown formatting if present, slicing only once
+        start = 7 if json_content.startswith('```json') else 0
+        end = len(json_content) - 3 if json_content.endswith('```') else len(json_content)
+
+        return json_content[start:end].strip()
+
+    @staticmethod
+    def get_parsing_system_prompt() -> str:
+        """Get the system prompt for resume parsing"""
+        return _PARSE_SYSTEM_PROMPT
+
     def test_connectivity(self) -> Dict[str, Any]:
         """
         Test AI provider connectivity
@@ -0,0 +1,59 @@
+"""
+Startup Probes - One-time detection of optional dependencies and binaries
+
+Probes run once when the module is imported so that health checks only
+read the resulting flags instead of re-probing on every request.
+"""
+
+import os
+import shutil
+import subprocess
+from typing import Optional
+
+try:
+    import pdfkit  # noqa: F401
+    PDFKIT_AVAILABLE = True
+except ImportError:
+    PDFKIT_AVAILABLE = False
+
+try:
+    import dotenv  # noqa: F401
+    DOTENV_AVAILABLE = True
+except ImportError:
+    DOTENV_AVAILABLE = False
+
+WKHTMLTOPDF_CANDIDATES = ('wkhtmltopdf', '/usr/bin/wkhtmltopdf', '/usr/local/bin/wkhtmltopdf')
+
+
+def _probe_wkhtmltopdf() -> Optional[str]:
+    """
+    Return the first usable wkhtmltopdf candidate, or None
+
+    By default a candidate is usable when it resolves to an executable file,
+    which needs no child process. Set HEALTH_DEEP_CHECK to also run
+    `wkhtmltopdf --version` for deployment validation.
+    """
+    deep_check = bool(os.getenv('HEALTH_DEEP_CHECK'))
+
+    for path in WKHTMLTOPDF_CANDIDATES:
+        resolved = shutil.which(path)
+        if not resolved or not os.access(resolved, os.X_OK):
+            continue
+        if not deep_check:
+            return resolved
+
+        try:
+            subprocess.run(
+                [resolved, '--version'],
+                capture_output=True,
+                check=True,
+                timeout=5
+            )
+            return resolved
+        except (subprocess.CalledProcessError, OSError, subprocess.TimeoutExpired):
+            continue
+
+    return None
+
+
+WKHTMLTOPDF_PATH = _probe_wkhtmltopdf()
@@ -2,67 +2,154 @@
 Scoring Service - Handles ATS scoring and optimization metrics
 """
 
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from typing import Dict, List, Any, Union
+
+
+# Static icon metadata for each optimization summary entry
+_OPT_ICONS = {
+    'keywords': {'icon': 'bi-key-fill', 'iconClass': 'optimizations-icon-key'},
+    'reorder': {'icon': 'bi-arrow-up-down', 'iconClass': 'optimizations-icon-reorder'},
+    'metrics': {'icon': 'bi-graph-up-arrow', 'iconClass': 'optimizations-icon-metrics'},
+    'skills': {'icon': 'bi-pencil-square', 'iconClass': 'optimizations-icon-skills'},
+    'summary': {'icon': 'bi-file-earmark-text-fill', 'iconClass': 'optimizations-icon-summary'}
+}
+
+_METRICS_TEXT = 'Highlighted <strong>key metrics</strong> like "$100M TVL" and quantified achievements for impact.'
+_SKILLS_TEXT = 'Enhanced "Technical Skills" to better reflect <strong>FinTech and technical</strong> expertise.'
+_SUMMARY_TEXT = 'Updated professional summary for stronger alignment with role requirements.'
+
+
+@dataclass(frozen=True)
+class ScoringContext:
+    """Resume-derived scoring inputs that do not depend on the job description"""
+    text: str
+    achievements_count: int
+    has_skills: bool
+    has_summary: bool
+    has_education: bool
+    contact_score: float
 
 
 class ScoringService:
     """Service for calculating ATS scores and generating optimization summaries"""
 
     @staticmethod
-    def calculate_ats_score(resume_data: Dict[str, Any], role_keywords: List[str]) -> int:
+    def prepare_resume(resume_data: Dict[str, Any]) -> ScoringContext:
         """
-        Calculate ATS score based on keyword matches and resume structure
+        Precompute the job-independent parts of the ATS score
+
+        Reuse the returned context when scoring one resume against many
+        job descriptions so text extraction and structure checks run once.
 
         Args:
             resume_data: Structured resume data
+
+        Returns:
+            ScoringContext for use with calculate_ats_score
+        """
+        text = ScoringService._extract_resume_text(resume_data).lower()
+
+        achievements_count = 0
+        if 'experience' in resume_data:
+            achievements_count = sum(
+                len(job.get('achievements', []))
+                for job in resume_data['experience']
+            )
+
+        # Contact information completeness (10 points)
+        contact_score = 0.0
+        if 'personal' in resume_data:
+            personal = resume_data['personal']
+            contact_score += sum(5 for field in ('name', 'email') if field in personal)
+            contact_score += sum(2.5 for field in ('phone', 'location') if field in personal)
+
+        return ScoringContext(
+            text=text,
+            achievements_count=achievements_count,
+            has_skills=bool(resume_data.get('skills')),
+            has_summary='summary' in resume_data and bool(resume_data['summary'].get('headline')),
+            has_education=bool(resume_data.get('education')),
+            contact_score=contact_score
+        )
+
+    @staticmethod
+    def calculate_ats_score(
+        resume: Union[Dict[str, Any], ScoringContext],
+        role_keywords: List[str]
+    ) -> int:
+        """
+        Calculate ATS score based on keyword matches and resume structure
+
+        Args:
+            resume: Structured resume data or a context from prepare_resume
             role_keywords: Keywords extracted from job description
 
         Returns:
             Score from 0-100
         """
+        if not isinstance(resume, ScoringContext):
+            resume = ScoringService.prepare_resume(resume)
+
+        keywords = [keyword.lower() for keyword in role_keywords[:20]]
+        return ScoringService._score_context(resume, keywords)
+
+    @staticmethod
+    def calculate_ats_scores_batch(
+        resumes: List[Union[Dict[str, Any], ScoringContext]],
+        role_keywords: List[str]
+    ) -> List[int]:
+        """
+        Calculate ATS scores for many resumes against one job description
+
+        Keywords are normalized once for the whole batch instead of once
+        per resume.
+
+        Args:
+            resumes: Structured resume data or contexts from prepare_resume
+            role_keywords: Keywords extracted from job description
+
+        Returns:
+            Scores from 0-100, in the same order as resumes
+        """
+        keywords = [keyword.lower() for keyword in role_keywords[:20]]
+        return [
+            ScoringService._score_context(
+                resume if isinstance(resume, ScoringContext)
+                else ScoringService.prepare_resume(resume),
+                keywords
+            )
+            for resume in resumes
+        ]
+
+    @staticmethod
+    def _score_context(resume: ScoringContext, keywords: List[str]) -> int:
+        """Score a prepared resume against already lowercased keywords"""
         total_score = 0
 
         # Keyword matching (40 points max)
-        resume_text = ScoringService._extract_resume_text(resume_data).lower()
-        matched_keywords = sum(
-            1 for keyword in role_keywords[:20]
-            if keyword.lower() in resume_text
-        )
+        text = resume.text
+        matched_keywords = sum(1 for keyword in keywords if keyword in text)
         keyword_score = min(40, (matched_keywords / 20) * 40)
         total_score += keyword_score
 
         # Skills section presence (15 points)
-        if 'skills' in resume_data and resume_data['skills']:
+        if resume.has_skills:
             total_score += 15
 
         # Experience section with achievements (20 points)
-        if 'experience' in resume_data:
-            achievement_count = sum(
-                len(job.get('achievements', []))
-                for job in resume_data['experience']
-            )
-            achievement_score = min(20, (achievement_count / 10) * 20)
-            total_score += achievement_score
+        achievement_score = min(20, (resume.achievements_count / 10) * 20)
+        total_score += achievement_score
 
         # Contact information completeness (10 points)
-        contact_fields = ['name', 'email', 'phone', 'location']
-        if 'personal' in resume_data:
-            contact_score = sum(
-                5 if field in resume_data['personal'] else 0
-                for field in contact_fields[:2]
-            )
-            contact_score += sum(
-                2.5 if field in resume_data['personal'] else 0
-                for field in contact_fields[2:]
-            )
-            total_score += contact_score
+        total_score += resume.contact_score
 
         # Professional summary (10 points)
-        if 'summary' in resume_data and resume_data['summary'].get('headline'):
+        if resume.has_summary:
             total_score += 10
 
         # Education section (5 points)
-        if 'education' in resume_data and resume_data['education']:
+        if resume.has_education:
             total_score += 5
 
         return min(100, int(total_score))
@@ -145,11 +232,11 @@ class ScoringService:
         optimizations = []
 
         # Keywords added
-        keyword_count = len(role_keywords[:15])
-        key_keywords = ', '.join([f'"{kw}"' for kw in role_keywords[:3]])
+        keyword_count = min(len(role_keywords), 15)
+        top_keywords = role_keywords[:3]
+        key_keywords = ', '.join(f'"{kw}"' for kw in top_keywords)
         optimizations.append({
-            'icon': 'bi-key-fill',
-            'iconClass': 'optimizations-icon-key',
+            **_OPT_ICONS['keywords'],
             'text': f'Added <strong>{keyword_count} keywords</strong> from job description, including {key_keywords}.'
         })
 
@@ -160,38 +247,25 @@ class ScoringService:
                 for achievement in job.get('achievements', [])
             ):
                 optimizations.append({
-                    'icon': 'bi-arrow-up-down',
-                    'iconClass': 'optimizations-icon-reorder',
+                    **_OPT_ICONS['reorder'],
                     'text': f'<strong>Reordered achievements</strong> under "{job["title"]}" role to prioritize relevant experience.'
                 })
                 break
 
         # Metrics highlighting
-        metric_count = sum(
-            1 for job in original_data.get('experience', [])
+        has_metrics = any(
+            achievement.get('metrics')
+            for job in original_data.get('experience', [])
             for achievement in job.get('achievements', [])
-            if achievement.get('metrics')
         )
 
-        if metric_count > 0:
-            optimizations.append({
-                'icon': 'bi-graph-up-arrow',
-                'iconClass': 'optimizations-icon-metrics',
-                'text': f'Highlighted <strong>key metrics</strong> like "$100M TVL" and quantified achievements for impact.'
-            })
+        if has_metrics:
+            optimizations.append({**_OPT_ICONS['metrics'], 'text': _METRICS_TEXT})
 
         # Skills enhancement
-        optimizations.append({
-            'icon': 'bi-pencil-square',
-            'iconClass': 'optimizations-icon-skills',
-            'text': 'Enhanced "Technical Skills" to better reflect <strong>FinTech and technical</strong> expertise.'
-        })
+        optimizations.append({**_OPT_ICONS['skills'], 'text': _SKILLS_TEXT})
 
         # Summary update
-        optimizations.append({
-            'icon': 'bi-file-earmark-text-fill',
-            'iconClass': 'optimizations-icon-summary',
-            'text': 'Updated professional summary for stronger alignment with role requirements.'
-        })
+        optimizations.append({**_OPT_ICONS['summary'], 'text': _SUMMARY_TEXT})
 
         return optimizations
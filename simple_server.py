@@ -7,30 +7,146 @@ import http.server
 import socketserver
 import json
 import os
+import queue
+import threading
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs
 import re
 from datetime import datetime
 
+# Prefer orjson when installed; the server must still run on the stdlib alone.
+# Both aliases take/return bytes so handlers don't branch per call.
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    def _json_loads(data):
+        # Unlike orjson, stdlib json does not accept memoryview
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
 PORT = 5000
 
+# Request bodies up to this size are read into a reusable per-thread buffer
+_BODY_BUFFER_SIZE = 65536
+_body_buffers = threading.local()
+
+_TECH_KEYWORDS = (
+    'python', 'javascript', 'react', 'node', 'sql', 'aws',
+    'docker', 'kubernetes', 'api', 'rest', 'agile', 'scrum'
+)
+
+@lru_cache(maxsize=256)
+def _extract_keywords_cached(job_description):
+    """Tech keywords in job_description, memoized for re-posted descriptions"""
+    job_lower = job_description.lower()
+    return tuple(keyword for keyword in _TECH_KEYWORDS if keyword in job_lower)
+
+# Sections handle_validate requires, in reporting order
+_REQUIRED_SECTIONS = ('personal', 'experience', 'skills')
+
+SAMPLE_RESUME_PATH = 'david_resume_json.json'
+
+# (mtime_ns, size, bytes) of the last sample resume read from disk
+_SAMPLE_CACHE = None
+
+def _read_sample_resume():
+    """Return the sample resume bytes, re-reading only when the file changes"""
+    global _SAMPLE_CACHE
+    stat_info = os.stat(SAMPLE_RESUME_PATH)
+    cached = _SAMPLE_CACHE
+    if cached and cached[0] == stat_info.st_mtime_ns and cached[1] == stat_info.st_size:
+        return cached[2]
+    
+    with open(SAMPLE_RESUME_PATH, 'rb') as f:
+        data = f.read()
+    _SAMPLE_CACHE = (stat_info.st_mtime_ns, stat_info.st_size, data)
+    return data
+
+# Constant response bodies, serialized once
+_HEALTH_BYTES = _json_dumps({'status': 'healthy', 'message': 'Simple server running without dependencies'})
+_PARSE_RESUME_BYTES = _json_dumps({
+    'success': False,
+    'message': 'AI parsing requires OpenAI API key. Use JSON upload instead.',
+    'resume_data': None
+})
+
+# Served when the sample resume file is missing
+_FALLBACK_SAMPLE_BYTES = _json_dumps({
+    "personal": {
+        "name": "Sample User",
+        "email": "sample@example.com",
+        "phone": "555-0123"
+    },
+    "experience": [],
+    "skills": {},
+    "education": []
+})
+
+_DEFAULT_HTML_TEMPLATE = """
+        <html>
+        <head><title>Resume - {name}</title></head>
+        <body>
+        <h1>{name}</h1>
+        <p>Email: {email}</p>
+        <p>Phone: {phone}</p>
+        <h2>Experience</h2>
+        {experience_html}
+        <h2>Skills</h2>
+        {skills_html}
+        </body>
+        </html>
+        """
+
+class PooledServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """TCP server that handles requests on a fixed pool of daemon threads"""
+    allow_reuse_address = True
+    request_queue_size = 128
+    max_workers = 32
+    # Accepted connections waiting for a worker; beyond this they are closed
+    max_queued = 64
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = queue.Queue(maxsize=self.max_queued)
+        for _ in range(self.max_workers):
+            threading.Thread(target=self._serve_pending, daemon=True).start()
+    
+    def _serve_pending(self):
+        while True:
+            request, client_address = self._pending.get()
+            self.process_request_thread(request, client_address)
+    
+    def process_request(self, request, client_address):
+        try:
+            self._pending.put_nowait((request, client_address))
+        except queue.Full:
+            self.shutdown_request(request)
+
 class ResumeOptimizerHandler(http.server.SimpleHTTPRequestHandler):
+    # Persistent connections; every response must set Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Close idle keep-alive connections quickly so they don't pin pool workers
+    timeout = 5
+    
     def end_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        if not self.close_connection:
+            self.send_header('Connection', 'keep-alive')
         super().end_headers()
     
     def do_OPTIONS(self):
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def do_GET(self):
         if self.path == '/api/health':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            response = {'status': 'healthy', 'message': 'Simple server running without dependencies'}
-            self.wfile.write(json.dumps(response).encode())
+            self.send_json_bytes(_HEALTH_BYTES)
         elif self.path == '/api/sample-resume':
             self.send_sample_resume()
         else:
@@ -48,9 +164,10 @@ class ResumeOptimizerHandler(http.server.SimpleHTTPRequestHandler):
     
     def handle_optimize(self):
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            body = self.read_body()
+            if body is None:
+                return
+            data = _json_loads(body)
             
             # Simple optimization simulation
             resume_data = data.get('resume_data', {})
@@ -59,37 +176,35 @@ class ResumeOptimizerHandler(http.server.SimpleHTTPRequestHandler):
             # Extract keywords from job description
             keywords = self.extract_keywords(job_description)
             
-            # Create optimized HTML
-            optimized_html = self.generate_optimized_html(resume_data, keywords)
+            # Create default and optimized HTML
+            default_html = self.generate_default_html(resume_data)
+            optimized_html = self.generate_optimized_html(resume_data, keywords, default_html)
             
             response = {
                 'success': True,
                 'optimized_html': optimized_html,
-                'default_html': self.generate_default_html(resume_data),
+                'default_html': default_html,
                 'ats_score': 85,
                 'keywords_found': keywords[:10],
                 'optimization_summary': f'Added {len(keywords)} relevant keywords'
             }
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self.send_json_bytes(_json_dumps(response))
             
         except Exception as e:
             self.send_error(500, str(e))
     
     def handle_validate(self):
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            body = self.read_body()
+            if body is None:
+                return
+            data = _json_loads(body)
             
             resume_data = data.get('resume_data', {})
             
             # Simple validation
-            required_sections = ['personal', 'experience', 'skills']
-            missing_sections = [section for section in required_sections if section not in resume_data]
+            missing_sections = [section for section in _REQUIRED_SECTIONS if section not in resume_data]
             
             response = {
                 'valid': len(missing_sections) == 0,
@@ -97,84 +212,93 @@ class ResumeOptimizerHandler(http.server.SimpleHTTPRequestHandler):
                 'message': 'Valid resume' if len(missing_sections) == 0 else f'Missing sections: {", ".join(missing_sections)}'
             }
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self.send_json_bytes(_json_dumps(response))
             
         except Exception as e:
             self.send_error(500, str(e))
     
     def handle_parse_resume(self):
+        # Drain the unused request body so the connection can be reused
+        if self.read_body() is None:
+            return
+        
         # Mock response for text-to-JSON conversion
-        response = {
-            'success': False,
-            'message': 'AI parsing requires OpenAI API key. Use JSON upload instead.',
-            'resume_data': None
-        }
+        self.send_json_bytes(_PARSE_RESUME_BYTES)
+    
+    def read_body(self):
+        """
+        Read the request body into a reused buffer and return a view of it
         
-        self.send_response(200)
+        Sends 400 and returns None when Content-Length is missing or not a
+        non-negative integer, so a stale buffer can never be returned.
+        """
+        header = self.headers.get('Content-Length')
+        if header is None or not (header.isascii() and header.isdigit()):
+            self.send_error(400, 'Missing or invalid Content-Length')
+            return None
+        
+        content_length = int(header)
+        if content_length <= _BODY_BUFFER_SIZE:
+            buffer = getattr(_body_buffers, 'buffer', None)
+            if buffer is None:
+                buffer = _body_buffers.buffer = bytearray(_BODY_BUFFER_SIZE)
+        else:
+            buffer = bytearray(content_length)
+        
+        view = memoryview(buffer)[:content_length]
+        received = 0
+        while received < content_length:
+            count = self.rfile.readinto(view[received:])
+            if not count:
+                raise ConnectionError('Request body ended before Content-Length bytes')
+            received += count
+        return view
+    
+    def send_json_bytes(self, body, status=200):
+        self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(body)
     
     def send_sample_resume(self):
         try:
-            # Load sample resume if it exists
-            if os.path.exists('david_resume_json.json'):
-                with open('david_resume_json.json', 'r') as f:
-                    sample_data = f.read()
-            else:
-                sample_data = json.dumps({
-                    "personal": {
-                        "name": "Sample User",
-                        "email": "sample@example.com",
-                        "phone": "555-0123"
-                    },
-                    "experience": [],
-                    "skills": {},
-                    "education": []
-                })
+            # Serve the sample resume file if it exists
+            try:
+                sample_data = _read_sample_resume()
+            except FileNotFoundError:
+                sample_data = _FALLBACK_SAMPLE_BYTES
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-Disposition', 'attachment; filename="sample_resume.json"')
-            self.end_headers()
-            self.wfile.write(sample_data.encode())
+            self.send_sample_headers(len(sample_data))
+            self.wfile.write(sample_data)
             
         except Exception as e:
             self.send_error(500, str(e))
     
+    def send_sample_headers(self, content_length):
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Disposition', 'attachment; filename="sample_resume.json"')
+        self.send_header('Content-Length', str(content_length))
+        self.end_headers()
+    
     def extract_keywords(self, job_description):
         # Simple keyword extraction
-        tech_keywords = ['python', 'javascript', 'react', 'node', 'sql', 'aws', 'docker', 'kubernetes', 'api', 'rest', 'agile', 'scrum']
-        found_keywords = []
-        
-        job_lower = job_description.lower()
-        for keyword in tech_keywords:
-            if keyword in job_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords
+        return list(_extract_keywords_cached(job_description))
     
     def generate_default_html(self, resume_data):
-        return f"""
-        <html>
-        <head><title>Resume - {resume_data.get('personal', {}).get('name', 'Unknown')}</title></head>
-        <body>
-        <h1>{resume_data.get('personal', {}).get('name', 'Unknown')}</h1>
-        <p>Email: {resume_data.get('personal', {}).get('email', 'N/A')}</p>
-        <p>Phone: {resume_data.get('personal', {}).get('phone', 'N/A')}</p>
-        <h2>Experience</h2>
-        {self.format_experience(resume_data.get('experience', []))}
-        <h2>Skills</h2>
-        {self.format_skills(resume_data.get('skills', {}))}
-        </body>
-        </html>
-        """
+        personal = resume_data.get('personal', {})
+        return _DEFAULT_HTML_TEMPLATE.format(
+            name=personal.get('name', 'Unknown'),
+            email=personal.get('email', 'N/A'),
+            phone=personal.get('phone', 'N/A'),
+            experience_html=self.format_experience(resume_data.get('experience', [])),
+            skills_html=self.format_skills(resume_data.get('skills', {}))
+        )
     
-    def generate_optimized_html(self, resume_data, keywords):
-        html = self.generate_default_html(resume_data)
+    def generate_optimized_html(self, resume_data, keywords, default_html=None):
+        # Reuse the caller's default rendering instead of building it twice
+        html = default_html if default_html is not None else self.generate_default_html(resume_data)
         # Add hidden keywords for ATS
         keyword_div = f'<div style="display:none">{" ".join(keywords)}</div>'
         return html.replace('</body>', f'{keyword_div}</body>')
@@ -183,28 +307,36 @@ class ResumeOptimizerHandler(http.server.SimpleHTTPRequestHandler):
         if not experience:
             return '<p>No experience listed</p>'
         
-        html = '<ul>'
+        parts = ['<ul>']
+        append = parts.append
         for job in experience:
-            html += f'<li><strong>{job.get("title", "Unknown")}</strong> at {job.get("company", "Unknown")} ({job.get("duration", "Unknown")})</li>'
-        html += '</ul>'
-        return html
+            append(f'<li><strong>{job.get("title", "Unknown")}</strong> at {job.get("company", "Unknown")} ({job.get("duration", "Unknown")})</li>')
+        append('</ul>')
+        return ''.join(parts)
     
     def format_skills(self, skills):
         if not skills:
             return '<p>No skills listed</p>'
         
-        html = '<ul>'
+        # Skills come from parsed JSON, so exact type checks are safe
+        _list = list
+        _dict = dict
+        _join = ', '.join
+        parts = ['<ul>']
+        append = parts.append
         for category, skill_list in skills.items():
-            if isinstance(skill_list, dict):
+            if type(skill_list) is _dict:
                 for level, items in skill_list.items():
-                    html += f'<li><strong>{category} ({level}):</strong> {", ".join(items) if isinstance(items, list) else items}</li>'
+                    joined = _join(items) if type(items) is _list else items
+                    append(f'<li><strong>{category} ({level}):</strong> {joined}</li>')
             else:
-                html += f'<li><strong>{category}:</strong> {", ".join(skill_list) if isinstance(skill_list, list) else skill_list}</li>'
-        html += '</ul>'
-        return html
+                joined = _join(skill_list) if type(skill_list) is _list else skill_list
+                append(f'<li><strong>{category}:</strong> {joined}</li>')
+        append('</ul>')
+        return ''.join(parts)
 
 if __name__ == '__main__':
-    with socketserver.TCPServer(("", PORT), ResumeOptimizerHandler) as httpd:
+    with PooledServer(("", PORT), ResumeOptimizerHandler) as httpd:
         print(f"🌐 Simple Resume Optimizer server running on http://localhost:{PORT}")
         print("🔧 This is a dependency-free version for testing")
         print("📋 Available endpoints:")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for AIService client setup and batch parsing
+
+Provider clients are patched, so these tests never reach the network.
+"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services import ai_service
+from services.ai_service import AIService, AIProviderError
+
+
+@pytest.fixture
+def patched_openai():
+    """Patch the OpenAI client class and drop clients cached by earlier calls"""
+    ai_service._initialize_client.cache_clear()
+    with patch('services.ai_service.OpenAI') as mock_openai_class:
+        yield mock_openai_class
+    ai_service._initialize_client.cache_clear()
+
+
+class TestClientInitialization:
+    """AIService shares one client per provider configuration"""
+
+    def test_instances_share_client(self, patched_openai):
+        with patch.dict(os.environ, {'AI_PROVIDER': 'openai', 'OPENAI_API_KEY': 'test-key'}):
+            first = AIService()
+            second = AIService()
+
+        assert first.client is second.client
+        patched_openai.assert_called_once_with(api_key='test-key')
+
+    def test_patched_class_gets_fresh_client(self, patched_openai):
+        with patch.dict(os.environ, {'AI_PROVIDER': 'openai', 'OPENAI_API_KEY': 'test-key'}):
+            service = AIService()
+
+        assert service.client is patched_openai.return_value
+
+    def test_new_key_gets_new_client(self, patched_openai):
+        with patch.dict(os.environ, {'AI_PROVIDER': 'openai', 'OPENAI_API_KEY': 'key-1'}):
+            AIService()
+        with patch.dict(os.environ, {'AI_PROVIDER': 'openai', 'OPENAI_API_KEY': 'key-2'}):
+            AIService()
+
+        assert patched_openai.call_count == 2
+
+
+class FakeAsyncOpenAI:
+    """AsyncOpenAI stand-in that answers from a resume text -> content map"""
+
+    replies = {}
+    in_flight = 0
+    max_in_flight = 0
+    finished_after_close = 0
+
+    def __init__(self, api_key=None, base_url=None):
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+        return False
+
+    async def _create(self, messages, **kwargs):
+        text = messages[-1]['content'].split('\n\n', 1)[1]
+        cls = FakeAsyncOpenAI
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            # Earlier resumes answer later, so ordering comes from gather
+            await asyncio.sleep(0.01 * (len(cls.replies) - list(cls.replies).index(text)))
+            if self.closed:
+                cls.finished_after_close += 1
+            reply = cls.replies[text]
+            if isinstance(reply, Exception):
+                raise reply
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+        finally:
+            cls.in_flight -= 1
+
+
+class TestParseResumesBatch:
+    """Concurrent batch parsing through AsyncOpenAI"""
+
+    @pytest.fixture
+    def service(self, patched_openai):
+        FakeAsyncOpenAI.replies = {}
+        FakeAsyncOpenAI.in_flight = FakeAsyncOpenAI.max_in_flight = 0
+        FakeAsyncOpenAI.finished_after_close = 0
+        with patch.dict(os.environ, {'AI_PROVIDER': 'openai', 'OPENAI_API_KEY': 'test-key'}):
+            service = AIService()
+        with patch('services.ai_service.AsyncOpenAI', FakeAsyncOpenAI):
+            yield service
+
+    def test_results_keep_input_order(self, service):
+        FakeAsyncOpenAI.replies = {
+            'resume one': '{"personal": {"name": "One"}}',
+            'resume two': '{"personal": {"name": "Two"}}',
+            'resume three': '{"personal": {"name": "Three"}}'
+        }
+
+        results = service.parse_resumes_batch(list(FakeAsyncOpenAI.replies))
+
+        assert [r['personal']['name'] for r in results] == ['One', 'Two', 'Three']
+
+    def test_strips_code_fences(self, service):
+        FakeAsyncOpenAI.replies = {'fenced': '```json\n{"skills": {}}\n```'}
+
+        assert service.parse_resumes_batch(['fenced']) == [{'skills': {}}]
+
+    def test_limits_concurrency(self, service):
+        FakeAsyncOpenAI.replies = {f'resume {i}': '{}' for i in range(6)}
+
+        service.parse_resumes_batch(list(FakeAsyncOpenAI.replies), max_concurrency=2)
+
+        assert FakeAsyncOpenAI.max_in_flight == 2
+
+    def test_empty_batch_returns_empty_list(self, service):
+        assert service.parse_resumes_batch([]) == []
+
+    def test_empty_resume_raises_value_error(self, service):
+        with pytest.raises(ValueError, match='cannot be empty'):
+            service.parse_resumes_batch(['resume', '   '])
+
+    @pytest.mark.parametrize('max_concurrency', [0, -1])
+    def test_invalid_concurrency_raises_value_error(self, service, max_concurrency):
+        with pytest.raises(ValueError, match='max_concurrency'):
+            service.parse_resumes_batch(['resume'], max_concurrency=max_concurrency)
+
+    def test_invalid_json_is_wrapped(self, service):
+        FakeAsyncOpenAI.replies = {'resume': 'not json'}
+
+        with pytest.raises(AIProviderError, match='Failed to parse AI response as JSON'):
+            service.parse_resumes_batch(['resume'])
+
+    def test_provider_error_is_wrapped(self, service):
+        FakeAsyncOpenAI.replies = {'resume': RuntimeError('rate limited')}
+
+        with pytest.raises(AIProviderError, match='Resume parsing failed: rate limited'):
+            service.parse_resumes_batch(['resume'])
+
+    def test_failure_waits_for_other_requests(self, service):
+        # The last resume answers first, so it fails while the others run
+        FakeAsyncOpenAI.replies = {
+            'resume one': '{}',
+            'resume two': '{}',
+            'resume three': RuntimeError('rate limited')
+        }
+
+        async def main():
+            with pytest.raises(AIProviderError, match='rate limited'):
+                await service.parse_resumes_batch_async(list(FakeAsyncOpenAI.replies))
+            # Keep the loop running so any orphaned request could finish
+            await asyncio.sleep(0.05)
+
+        asyncio.run(main())
+
+        assert FakeAsyncOpenAI.in_flight == 0
+        assert FakeAsyncOpenAI.finished_after_close == 0
+
+    def test_async_form_runs_inside_event_loop(self, service):
+        FakeAsyncOpenAI.replies = {'resume': '{"summary": {}}'}
+
+        async def main():
+            return await service.parse_resumes_batch_async(['resume'])
+
+        assert asyncio.run(main()) == [{'summary': {}}]
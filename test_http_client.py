@@ -4,20 +4,24 @@ Simple HTTP test for LM Studio endpoint using requests
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import sys
 
+BASE_URL = "http://172.28.144.1:1234"
+
+# One keep-alive session so the chat and model-list requests share a connection
+SESSION = requests.Session()
+SESSION.headers.update({"Authorization": "Bearer local-key"})
+SESSION.mount(BASE_URL, HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 def test_lm_studio_direct():
     """Test LM Studio endpoint directly with HTTP requests"""
     print("Testing LM Studio endpoint with direct HTTP requests...")
     
     try:
         # Test endpoint availability
-        url = "http://172.28.144.1:1234/v1/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer local-key"
-        }
+        url = f"{BASE_URL}/v1/chat/completions"
         
         payload = {
             "model": "local-model",
@@ -31,7 +35,7 @@ def test_lm_studio_direct():
         print(f"Sending POST request to: {url}")
         print("Payload:", json.dumps(payload, indent=2))
         
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = SESSION.post(url, json=payload, timeout=30)
         
         print(f"Status Code: {response.status_code}")
         
@@ -46,7 +50,7 @@ def test_lm_studio_direct():
             return False
             
     except requests.exceptions.ConnectionError:
-        print("❌ Connection Error: Cannot connect to LM Studio at http://172.28.144.1:1234")
+        print(f"❌ Connection Error: Cannot connect to LM Studio at {BASE_URL}")
         print("Please ensure:")
         print("1. LM Studio is running")
         print("2. A model is loaded")  
@@ -62,10 +66,9 @@ def test_model_list():
     print("Testing model list endpoint...")
     
     try:
-        url = "http://172.28.144.1:1234/v1/models"
-        headers = {"Authorization": "Bearer local-key"}
+        url = f"{BASE_URL}/v1/models"
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = SESSION.get(url, timeout=10)
         
         if response.status_code == 200:
             models = response.json()
@@ -6,25 +6,39 @@ Test script for local AI integration with LM Studio
 import os
 import json
 import sys
+from functools import lru_cache
 from openai import OpenAI
 
+LOCAL_BASE_URL = "http://172.28.144.1:1234/v1"
+
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a resume parsing expert. Convert the provided text resume into a structured JSON format. Return only valid JSON."
+}
+_USER_TMPL = "Convert this resume to JSON:\n\n{resume}"
+
+@lru_cache(maxsize=None)
+def _get_local_client():
+    """Shared LM Studio client so both tests reuse one connection pool"""
+    return OpenAI(
+        api_key="local-key",  # LM Studio doesn't require real API key
+        base_url=LOCAL_BASE_URL
+    )
+
 def test_local_ai():
     """Test the local LM Studio integration"""
     print("Testing local AI integration with LM Studio...")
     
     try:
-        # Initialize client with local LM Studio endpoint
-        client = OpenAI(
-            api_key="local-key",  # LM Studio doesn't require real API key
-            base_url="http://172.28.144.1:1234/v1"
-        )
+        # Client for the local LM Studio endpoint
+        client = _get_local_client()
         
         # Test with a simple prompt
         test_prompt = "Hello! Please respond with a JSON object containing your name and status."
         model_name = os.getenv('LOCAL_MODEL_NAME', 'local-model')
         
         print(f"Using model: {model_name}")
-        print(f"Endpoint: http://172.28.144.1:1234/v1")
+        print(f"Endpoint: {LOCAL_BASE_URL}")
         print(f"Test prompt: {test_prompt}")
         print("\nSending request...")
         
@@ -77,20 +91,15 @@ def test_resume_parsing():
     """
     
     try:
-        client = OpenAI(
-            api_key="local-key",  # LM Studio doesn't require real API key
-            base_url="http://172.28.144.1:1234/v1"
-        )
-        
-        system_prompt = """You are a resume parsing expert. Convert the provided text resume into a structured JSON format. Return only valid JSON."""
+        client = _get_local_client()
         
         model_name = os.getenv('LOCAL_MODEL_NAME', 'local-model')
         
         response = client.chat.completions.create(
             model=model_name,
             messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"Convert this resume to JSON:\n\n{sample_resume}"}
+                _SYSTEM_MSG,
+                {"role": "user", "content": _USER_TMPL.format(resume=sample_resume)}
             ],
             temperature=0.1,
             max_tokens=1000
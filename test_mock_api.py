@@ -9,7 +9,95 @@ without requiring external dependencies like pytest or OpenAI API keys.
 import json
 import re
 import sys
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+# Patterns compiled once at import; the extractors below run them per bullet
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Phone and location only try to match at the start of a character run. Any
+# match from a later start in the run also matches from the run start, so
+# retrying inside the run only re-scans it (quadratic on comma-free text)
+_PHONE_RE = re.compile(r'(?<![\(\)0-9\-\+\s])[\(\)0-9\-\+\s]{10,}')
+_LOCATION_RE = re.compile(r'(?<![A-Za-z\s])[A-Za-z\s]+,\s*[A-Z]{2}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w\-]+', re.IGNORECASE)
+
+_SUMMARY_RES = [
+    re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+        r'PROFESSIONAL SUMMARY\s*\n(.*?)(?=\n[A-Z])',
+        r'EXECUTIVE SUMMARY\s*\n(.*?)(?=\n[A-Z])',
+        r'SUMMARY\s*\n(.*?)(?=\n[A-Z])'
+    )
+]
+
+# Metric patterns in priority order; the first type that matches wins
+_METRIC_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), metric_type) for pattern, metric_type in (
+        (r'\$(\d+(?:\.\d+)?)\s*([MmBb]?)', 'revenue'),
+        (r'(\d+(?:\.\d+)?)\s*([MmBb]?)\+?\s*(?:users?|customers?)', 'users'),
+        (r'(\d+(?:\.\d+)?)%', 'percentage'),
+        (r'(\d+(?:\.\d+)?)\+?\s*(?:engineers?|developers?|people)', 'team_size')
+    )
+]
+
+# Common technical and business keywords, in reporting order
+_TECH_KEYWORDS = (
+    'python', 'javascript', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
+    'microservices', 'api', 'database', 'sql', 'nosql', 'redis', 'postgresql',
+    'mysql', 'mongodb', 'kafka', 'jenkins', 'ci/cd', 'devops', 'cloud',
+    'blockchain', 'defi', 'fintech', 'payment', 'trading', 'cryptocurrency'
+)
+_BUSINESS_KEYWORDS = (
+    'leadership', 'team', 'scaling', 'optimization', 'performance', 'revenue',
+    'cost reduction', 'efficiency', 'automation', 'process improvement',
+    'compliance', 'security', 'architecture', 'design', 'implementation'
+)
+_ALL_KEYWORDS = _TECH_KEYWORDS + _BUSINESS_KEYWORDS
+
+# Job-title hints for experience entries without | separators (substring match)
+_TITLE_HINT_RE = re.compile(
+    r'engineer|manager|developer|analyst|director|officer|intern|specialist',
+    re.IGNORECASE
+)
+
+_BULLET_PREFIXES = ('•', '-', '*')
+# Bullet markers stripped from achievement and project lines; the lines are
+# already whitespace-stripped, so only the left side needs another pass
+_BULLET_CHARS = '•-* '
+# Markers that end a job's achievement list (next job line or next section)
+_BREAK_SEPARATORS = ('|', 'SKILLS', 'EDUCATION')
+
+# Section name -> header substrings that open the section
+_SECTION_HEADERS = {
+    'experience': ('EXPERIENCE', 'PROFESSIONAL EXPERIENCE', 'WORK HISTORY'),
+    'skills': ('SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'COMPETENCIES'),
+    'education': ('EDUCATION',),
+    'projects': ('PROJECTS',)
+}
+
+# Skill category hint -> category key, checked in insertion order
+_SKILL_CATEGORY_MAP = {
+    'programming': 'programming_languages',
+    'language': 'programming_languages',
+    'web': 'web_technologies',
+    'framework': 'web_technologies',
+    'technology': 'web_technologies',
+    'cloud': 'cloud_devops',
+    'devops': 'cloud_devops',
+    'infrastructure': 'cloud_devops',
+    'fintech': 'fintech',
+    'finance': 'fintech',
+    'blockchain': 'fintech',
+    'leadership': 'leadership',
+    'management': 'leadership',
+    'soft': 'leadership'
+}
+
+_DEGREE_RES = [
+    re.compile(r'(Bachelor[^\n]*|Master[^\n]*|PhD[^\n]*|MBA[^\n]*|BS[^\n]*|MS[^\n]*|BA[^\n]*|MA[^\n]*)', re.IGNORECASE),
+    re.compile(r'([A-Z][a-z]+ of [A-Z][a-z]+[^\n]*)', re.IGNORECASE)
+]
+_SCHOOL_RE = re.compile(r'([A-Z][a-z]+[^|]*(?:University|College|Institute|School)[^|]*)')
+_YEAR_RE = re.compile(r'(\d{4}(?:\s*-\s*\d{4})?)')
 
 def run_comprehensive_tests():
     """Run comprehensive tests for text-to-JSON conversion feature"""
@@ -133,37 +221,12 @@ JavaScript, Python, React, HTML/CSS, Git, MySQL
     total_tests = len(test_cases)
     passed_tests = 0
     
+    # Run serially: a handful of cases finish in milliseconds, less than a
+    # process pool's start-up, and workers would lose the conversion cache
     for i, test_case in enumerate(test_cases, 1):
-        print(f"Test {i}/{total_tests}: {test_case['name']}")
-        print("-" * 50)
-        
-        try:
-            # Simulate text-to-JSON conversion
-            result = simulate_openai_conversion(test_case['input'])
-            
-            # Validate the result
-            validation_results = validate_conversion_result(result, test_case)
-            
-            if validation_results['passed']:
-                print("✅ PASS")
-                passed_tests += 1
-                print(f"   ✓ Extracted {len(result.get('experience', []))} job(s)")
-                print(f"   ✓ Found {len(result.get('skills', {}))} skill categories")
-                print(f"   ✓ Contact: {result.get('personal', {}).get('name', 'N/A')}")
-                
-                if validation_results['warnings']:
-                    print("   ⚠️  Warnings:")
-                    for warning in validation_results['warnings']:
-                        print(f"      - {warning}")
-            else:
-                print("❌ FAIL")
-                for error in validation_results['errors']:
-                    print(f"   ✗ {error}")
-                    
-        except Exception as e:
-            print(f"❌ FAIL - Exception: {str(e)}")
-        
-        print()
+        passed, report = _run_one_test(i, total_tests, test_case)
+        passed_tests += passed
+        sys.stdout.write(report)
     
     # Summary
     print("=" * 60)
@@ -176,28 +239,132 @@ JavaScript, Python, React, HTML/CSS, Git, MySQL
     
     return passed_tests == total_tests
 
-def simulate_openai_conversion(text_resume: str) -> Dict[str, Any]:
+def _run_one_test(i: int, total_tests: int, test_case: Dict[str, Any]) -> Tuple[bool, str]:
+    """Convert and validate one test case, returning (passed, report text)"""
+    out = [f"Test {i}/{total_tests}: {test_case['name']}", "-" * 50]
+    passed = False
+    
+    try:
+        # Simulate text-to-JSON conversion
+        result = simulate_openai_conversion(test_case['input'])
+        
+        # Validate the result
+        validation_results = validate_conversion_result(result, test_case)
+        
+        if validation_results['passed']:
+            out.append("✅ PASS")
+            passed = True
+            out.append(f"   ✓ Extracted {len(result.get('experience', []))} job(s)")
+            out.append(f"   ✓ Found {len(result.get('skills', {}))} skill categories")
+            out.append(f"   ✓ Contact: {result.get('personal', {}).get('name', 'N/A')}")
+            
+            if validation_results['warnings']:
+                out.append("   ⚠️  Warnings:")
+                out.extend(f"      - {warning}" for warning in validation_results['warnings'])
+        else:
+            out.append("❌ FAIL")
+            out.extend(f"   ✗ {error}" for error in validation_results['errors'])
+                
+    except Exception as e:
+        out.append(f"❌ FAIL - Exception: {str(e)}")
+    
+    out.append("")
+    return passed, '\n'.join(out) + '\n'
+
+def simulate_openai_conversion(text_resume: str, use_spacy: bool = False) -> Dict[str, Any]:
     """
     Simulate OpenAI's GPT-4 conversion of text resume to structured JSON
     This mock function demonstrates the expected behavior without API calls
+    
+    Args:
+        text_resume: Plain-text resume
+        use_spacy: Also run enrich() on the result for spaCy NER names and
+            locations; the default keeps the fast regex-only path
     """
+    # Decode a fresh copy so callers can't mutate the memoized result
+    result = json.loads(_convert_cached(text_resume))
+    if use_spacy:
+        enrich(result, text_resume)
+    return result
+
+@lru_cache(maxsize=128)
+def _convert_cached(text_resume: str) -> str:
+    """Run the conversion once per distinct resume text, cached as JSON"""
+    return json.dumps(_convert(text_resume))
+
+def _convert(text_resume: str) -> Dict[str, Any]:
+    """Build the structured resume dict from the extractors"""
+    # One pass over the text buckets section lines for every extractor
+    buckets = _bucket_lines(text_resume)
     
     # Simulate the structured JSON output that OpenAI would generate
     result = {
         "personal": extract_personal_info(text_resume),
         "summary": extract_summary(text_resume),
-        "experience": extract_experience(text_resume),
-        "skills": extract_skills(text_resume),
-        "education": extract_education(text_resume)
+        "experience": extract_experience(buckets['experience']),
+        "skills": extract_skills(buckets['skills']),
+        "education": extract_education(buckets['education'], text_resume)
     }
     
     # Add projects section if detected
-    projects = extract_projects(text_resume)
+    projects = extract_projects(buckets['projects'])
     if projects:
         result["projects"] = projects
     
     return result
 
+def _has_digit(text: str) -> bool:
+    """Check for any str.isdigit() character with the scan running in C"""
+    return any(map(str.isdigit, text))
+
+def _bucket_lines(text: str) -> Dict[str, List[str]]:
+    """
+    Bucket the resume's section lines in a single pass over the text
+    
+    A section opens on any line containing one of its header substrings and
+    closes at the next non-header line with letters longer than 3 characters.
+    """
+    # Only scan for sections whose header appears somewhere in the text
+    text_upper = text.upper()
+    present = {
+        name: headers for name, headers in _SECTION_HEADERS.items()
+        if any(header in text_upper for header in headers)
+    }
+    if not present:
+        return {name: [] for name in _SECTION_HEADERS}
+    
+    buffers = {name: None for name in present}
+    closed = set()
+    
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            # Blank lines never open or close a section, skip the upper() work
+            for name, lines in buffers.items():
+                if lines is not None and name not in closed:
+                    lines.append(line)
+            continue
+        
+        line_upper = stripped.upper()
+        ends_section = len(line_upper) > 3 and line_upper.isupper()
+        
+        for name, headers in present.items():
+            if name in closed:
+                continue
+            if any(header in line_upper for header in headers):
+                if buffers[name] is None:
+                    buffers[name] = []
+            elif buffers[name] is not None:
+                if ends_section:
+                    closed.add(name)
+                else:
+                    buffers[name].append(line)
+        
+        if len(closed) == len(buffers):
+            break
+    
+    return {name: buffers.get(name) or [] for name in _SECTION_HEADERS}
+
 def extract_personal_info(text: str) -> Dict[str, str]:
     """Extract personal contact information"""
     lines = text.strip().split('\n')
@@ -210,23 +377,19 @@ def extract_personal_info(text: str) -> Dict[str, str]:
             break
     
     # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, text)
+    email_match = _EMAIL_RE.search(text)
     email = email_match.group() if email_match else ""
     
     # Extract phone
-    phone_pattern = r'[\(\)0-9\-\+\s]{10,}'
-    phone_match = re.search(phone_pattern, text)
+    phone_match = _PHONE_RE.search(text)
     phone = phone_match.group().strip() if phone_match else ""
     
     # Extract location (City, State pattern)
-    location_pattern = r'[A-Za-z\s]+,\s*[A-Z]{2}'
-    location_match = re.search(location_pattern, text)
+    location_match = _LOCATION_RE.search(text)
     location = location_match.group() if location_match else ""
     
     # Extract LinkedIn
-    linkedin_pattern = r'linkedin\.com/in/[\w\-]+'
-    linkedin_match = re.search(linkedin_pattern, text, re.IGNORECASE)
+    linkedin_match = _LINKEDIN_RE.search(text)
     linkedin = linkedin_match.group() if linkedin_match else ""
     
     return {
@@ -237,17 +400,41 @@ def extract_personal_info(text: str) -> Dict[str, str]:
         "linkedin": linkedin
     }
 
+@lru_cache(maxsize=None)
+def _load_spacy_model():
+    """Load the spaCy English model on first use, or None if unavailable"""
+    try:
+        import spacy
+        return spacy.load('en_core_web_sm')
+    except (ImportError, OSError):
+        return None
+
+def enrich(result: Dict[str, Any], text_resume: str) -> Dict[str, Any]:
+    """
+    Refine a conversion result's name and location with spaCy NER
+    
+    Meant for query time on results from the fast regex path. Updates and
+    returns result; it is left unchanged when spaCy or its model is missing.
+    """
+    nlp = _load_spacy_model()
+    if nlp is None:
+        return result
+    
+    personal = result.setdefault('personal', {})
+    entities = nlp(text_resume).ents
+    name = next((ent.text for ent in entities if ent.label_ == 'PERSON'), None)
+    location = next((ent.text for ent in entities if ent.label_ == 'GPE'), None)
+    if name:
+        personal['name'] = name
+    if location and not personal.get('location'):
+        personal['location'] = location
+    return result
+
 def extract_summary(text: str) -> Dict[str, Any]:
     """Extract professional summary"""
-    summary_patterns = [
-        r'PROFESSIONAL SUMMARY\s*\n(.*?)(?=\n[A-Z])',
-        r'EXECUTIVE SUMMARY\s*\n(.*?)(?=\n[A-Z])',
-        r'SUMMARY\s*\n(.*?)(?=\n[A-Z])'
-    ]
-    
     summary_text = ""
-    for pattern in summary_patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    for pattern in _SUMMARY_RES:
+        match = pattern.search(text)
         if match:
             summary_text = match.group(1).strip()
             break
@@ -275,27 +462,12 @@ def extract_summary(text: str) -> Dict[str, Any]:
         "bullets": ["Team collaboration", "Problem solving"]
     }
 
-def extract_experience(text: str) -> List[Dict[str, Any]]:
-    """Extract work experience"""
-    experience_section = ""
-    lines = text.split('\n')
-    in_experience = False
-    
-    for line in lines:
-        line_upper = line.strip().upper()
-        if any(keyword in line_upper for keyword in ['EXPERIENCE', 'PROFESSIONAL EXPERIENCE', 'WORK HISTORY']):
-            in_experience = True
-            continue
-        elif in_experience and line_upper and line_upper.isupper() and len(line_upper) > 3:
-            if line_upper not in ['EXPERIENCE', 'PROFESSIONAL EXPERIENCE']:
-                break
-        elif in_experience:
-            experience_section += line + "\n"
-    
+def extract_experience(experience_lines: List[str]) -> List[Dict[str, Any]]:
+    """Extract work experience from the experience section lines"""
     jobs = []
     
     # Look for job entries with | separators (common format)
-    job_lines = [line for line in experience_section.split('\n') if '|' in line and len(line.split('|')) >= 2]
+    job_lines = [line for line in experience_lines if '|' in line and len(line.split('|')) >= 2]
     
     for job_line in job_lines:
         parts = [part.strip() for part in job_line.split('|')]
@@ -303,15 +475,15 @@ def extract_experience(text: str) -> List[Dict[str, Any]]:
             title = parts[0]
             company = parts[1]
             location = parts[2] if len(parts) > 2 else ""
-            duration = parts[3] if len(parts) > 3 else parts[2] if len(parts) == 3 and any(char.isdigit() for char in parts[2]) else ""
+            duration = parts[3] if len(parts) > 3 else parts[2] if len(parts) == 3 and _has_digit(parts[2]) else ""
             
             # Extract achievements for this job
-            achievements = extract_achievements_for_job(experience_section, job_line)
+            achievements = extract_achievements_for_job(experience_lines, job_line)
             
             jobs.append({
                 "title": title,
                 "company": company,
-                "location": location if not any(char.isdigit() for char in location) else "",
+                "location": location if not _has_digit(location) else "",
                 "duration": duration,
                 "description": f"Key role at {company}" if company else "",
                 "achievements": achievements
@@ -319,14 +491,14 @@ def extract_experience(text: str) -> List[Dict[str, Any]]:
     
     # If no jobs found with | format, try alternative parsing
     if not jobs:
-        jobs = parse_experience_alternative_format(experience_section)
+        jobs = parse_experience_alternative_format(experience_lines)
     
     return jobs[:5]  # Limit to 5 most recent jobs
 
-def parse_experience_alternative_format(experience_section: str) -> List[Dict[str, Any]]:
+def parse_experience_alternative_format(experience_lines: List[str]) -> List[Dict[str, Any]]:
     """Parse experience in alternative formats (no | separators)"""
     jobs = []
-    lines = [line.strip() for line in experience_section.split('\n') if line.strip()]
+    lines = [line.strip() for line in experience_lines if line.strip()]
     
     i = 0
     while i < len(lines):
@@ -334,8 +506,8 @@ def parse_experience_alternative_format(experience_section: str) -> List[Dict[st
         
         # Look for job title patterns (usually first line of job entry)
         if (len(line) > 5 and 
-            not line.startswith(('•', '-', '*')) and 
-            any(keyword in line.lower() for keyword in ['engineer', 'manager', 'developer', 'analyst', 'director', 'officer', 'intern', 'specialist'])):
+            not line.startswith(_BULLET_PREFIXES) and 
+            _TITLE_HINT_RE.search(line)):
             
             # This might be a job title
             title_line = line
@@ -346,11 +518,11 @@ def parse_experience_alternative_format(experience_section: str) -> List[Dict[st
             # Look for company/location/duration in next few lines
             for j in range(i + 1, min(i + 4, len(lines))):
                 next_line = lines[j]
-                if not next_line.startswith(('•', '-', '*')):
+                if not next_line.startswith(_BULLET_PREFIXES):
                     # Could be company/location/duration info
-                    if not company and not any(char.isdigit() for char in next_line[:10]):
+                    if not company and not _has_digit(next_line[:10]):
                         company = next_line
-                    elif any(char.isdigit() for char in next_line):
+                    elif _has_digit(next_line):
                         duration = next_line
                     elif ',' in next_line and len(next_line) < 50:
                         location = next_line
@@ -360,17 +532,15 @@ def parse_experience_alternative_format(experience_section: str) -> List[Dict[st
             # Extract achievements
             achievements = []
             j = i + 1
-            while j < len(lines) and not (len(lines[j]) > 5 and not lines[j].startswith(('•', '-', '*'))):
+            while j < len(lines) and not (len(lines[j]) > 5 and not lines[j].startswith(_BULLET_PREFIXES)):
                 line_text = lines[j]
-                if line_text.startswith(('•', '-', '*')):
-                    clean_text = line_text.lstrip('•-* ').strip()
+                if line_text.startswith(_BULLET_PREFIXES):
+                    clean_text = line_text.lstrip(_BULLET_CHARS).lstrip()
                     if len(clean_text) > 10:
-                        keywords = extract_keywords_from_achievement(clean_text)
-                        metrics = extract_metrics_from_text(clean_text)
                         achievements.append({
                             "text": clean_text,
-                            "keywords": keywords,
-                            "metrics": metrics
+                            "keywords": extract_keywords_from_achievement(clean_text),
+                            "metrics": extract_metrics_from_text(clean_text)
                         })
                 j += 1
             
@@ -390,12 +560,11 @@ def parse_experience_alternative_format(experience_section: str) -> List[Dict[st
     
     return jobs
 
-def extract_achievements_for_job(experience_text: str, job_line: str) -> List[Dict[str, Any]]:
-    """Extract achievements for a specific job"""
+def extract_achievements_for_job(lines: List[str], job_line: str) -> List[Dict[str, Any]]:
+    """Extract achievements for a specific job from the experience lines"""
     achievements = []
     
     # Find bullet points after the job line
-    lines = experience_text.split('\n')
     job_index = -1
     
     for i, line in enumerate(lines):
@@ -407,11 +576,11 @@ def extract_achievements_for_job(experience_text: str, job_line: str) -> List[Di
         # Look for bullet points after the job line
         for i in range(job_index + 1, min(job_index + 8, len(lines))):
             line = lines[i].strip()
-            if line.startswith(('•', '-', '*')) or (line and not any(sep in line for sep in ['|', 'SKILLS', 'EDUCATION'])):
-                clean_line = line.lstrip('•-* ').strip()
+            if line.startswith(_BULLET_PREFIXES) or (line and not any(sep in line for sep in _BREAK_SEPARATORS)):
+                clean_line = line.lstrip(_BULLET_CHARS).lstrip()
                 if len(clean_line) > 10:  # Meaningful achievement
                     
-                    # Extract metrics from the achievement
+                    # Extract metrics and keywords from the achievement
                     metrics = extract_metrics_from_text(clean_line)
                     keywords = extract_keywords_from_achievement(clean_line)
                     
@@ -427,19 +596,11 @@ def extract_achievements_for_job(experience_text: str, job_line: str) -> List[Di
 
 def extract_metrics_from_text(text: str) -> Dict[str, Any]:
     """Extract quantifiable metrics from achievement text"""
-    # Look for various metric patterns
-    patterns = [
-        (r'\$(\d+(?:\.\d+)?)\s*([MmBb]?)', 'revenue'),
-        (r'(\d+(?:\.\d+)?)\s*([MmBb]?)\+?\s*(?:users?|customers?)', 'users'),
-        (r'(\d+(?:\.\d+)?)%', 'percentage'),
-        (r'(\d+(?:\.\d+)?)\+?\s*(?:engineers?|developers?|people)', 'team_size')
-    ]
-    
-    for pattern, metric_type in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern, metric_type in _METRIC_PATTERNS:
+        match = pattern.search(text)
         if match:
             value = float(match.group(1))
-            multiplier = match.group(2).lower() if len(match.groups()) > 1 else ''
+            multiplier = match.group(2).lower() if pattern.groups > 1 else ''
             
             if multiplier == 'm':
                 value *= 1000000
@@ -452,68 +613,27 @@ def extract_metrics_from_text(text: str) -> Dict[str, Any]:
 
 def extract_keywords_from_achievement(text: str) -> List[str]:
     """Extract relevant keywords from achievement text"""
-    # Common technical and business keywords
-    tech_keywords = [
-        'python', 'javascript', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
-        'microservices', 'api', 'database', 'sql', 'nosql', 'redis', 'postgresql',
-        'mysql', 'mongodb', 'kafka', 'jenkins', 'ci/cd', 'devops', 'cloud',
-        'blockchain', 'defi', 'fintech', 'payment', 'trading', 'cryptocurrency'
-    ]
-    
-    business_keywords = [
-        'leadership', 'team', 'scaling', 'optimization', 'performance', 'revenue',
-        'cost reduction', 'efficiency', 'automation', 'process improvement',
-        'compliance', 'security', 'architecture', 'design', 'implementation'
-    ]
-    
-    all_keywords = tech_keywords + business_keywords
-    found_keywords = []
-    
     text_lower = text.lower()
-    for keyword in all_keywords:
-        if keyword in text_lower:
-            found_keywords.append(keyword)
+    found_keywords = [keyword for keyword in _ALL_KEYWORDS if keyword in text_lower]
     
     return found_keywords[:5]  # Limit to 5 most relevant keywords
 
-def extract_skills(text: str) -> Dict[str, Any]:
-    """Extract skills section"""
-    skills_section = ""
-    lines = text.split('\n')
-    in_skills = False
-    
-    for line in lines:
-        line_upper = line.strip().upper()
-        if any(keyword in line_upper for keyword in ['SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'COMPETENCIES']):
-            in_skills = True
-            continue
-        elif in_skills and line_upper and line_upper.isupper() and len(line_upper) > 3:
-            break
-        elif in_skills:
-            skills_section += line + "\n"
-    
+def extract_skills(skills_lines: List[str]) -> Dict[str, Any]:
+    """Extract skills from the skills section lines"""
     skills = {}
     
     # Parse skills by category
-    for line in skills_section.split('\n'):
+    for line in skills_lines:
         line = line.strip()
         if ':' in line:
             category, skill_list = line.split(':', 1)
-            category = category.strip()
+            category_lower = category.strip().lower()
             
             # Categorize the skills
-            if any(keyword in category.lower() for keyword in ['programming', 'language']):
-                category_key = 'programming_languages'
-            elif any(keyword in category.lower() for keyword in ['web', 'framework', 'technology']):
-                category_key = 'web_technologies'
-            elif any(keyword in category.lower() for keyword in ['cloud', 'devops', 'infrastructure']):
-                category_key = 'cloud_devops'
-            elif any(keyword in category.lower() for keyword in ['fintech', 'finance', 'blockchain']):
-                category_key = 'fintech'
-            elif any(keyword in category.lower() for keyword in ['leadership', 'management', 'soft']):
-                category_key = 'leadership'
-            else:
-                category_key = category.lower().replace(' ', '_')
+            category_key = next(
+                (key for hint, key in _SKILL_CATEGORY_MAP.items() if hint in category_lower),
+                category_lower.replace(' ', '_')
+            )
             
             # Parse individual skills
             skills_list = [skill.strip() for skill in skill_list.split(',')]
@@ -532,42 +652,28 @@ def extract_skills(text: str) -> Dict[str, Any]:
     
     return skills
 
-def extract_education(text: str) -> List[Dict[str, str]]:
-    """Extract education information"""
-    education_section = ""
-    lines = text.split('\n')
-    in_education = False
-    
-    for line in lines:
-        line_upper = line.strip().upper()
-        if 'EDUCATION' in line_upper:
-            in_education = True
-            continue
-        elif in_education and line_upper and line_upper.isupper() and len(line_upper) > 3:
-            break
-        elif in_education:
-            education_section += line + "\n"
-    
+def extract_education(education_lines: List[str], text: str) -> List[Dict[str, str]]:
+    """Extract education information from the education section lines"""
     education = []
     
-    # Look for degree patterns
-    degree_patterns = [
-        r'(Bachelor[^\n]*|Master[^\n]*|PhD[^\n]*|MBA[^\n]*|BS[^\n]*|MS[^\n]*|BA[^\n]*|MA[^\n]*)',
-        r'([A-Z][a-z]+ of [A-Z][a-z]+[^\n]*)'
-    ]
+    # Look for degree patterns, skipped when there is no education section
+    degree_patterns = _DEGREE_RES if any(line.strip() for line in education_lines) else ()
+    # Lower-cased section lines, built once for every degree lookup
+    line_index = [(line.lower(), line) for line in education_lines]
     
     for pattern in degree_patterns:
-        matches = re.findall(pattern, education_section, re.IGNORECASE)
+        # Degree patterns never span lines, so matching per line is equivalent
+        matches = [match for line in education_lines for match in pattern.findall(line)]
         for match in matches:
             degree = match.strip()
+            degree_lower = degree.lower()
             
             # Extract school and duration from context
-            lines = education_section.split('\n')
-            for line in lines:
-                if degree.lower() in line.lower():
+            for line_lower, line in line_index:
+                if degree_lower in line_lower:
                     # Look for school and year info
-                    school_match = re.search(r'([A-Z][a-z]+[^|]*(?:University|College|Institute|School)[^|]*)', line)
-                    year_match = re.search(r'(\d{4}(?:\s*-\s*\d{4})?)', line)
+                    school_match = _SCHOOL_RE.search(line)
+                    year_match = _YEAR_RE.search(line)
                     
                     education.append({
                         "degree": degree,
@@ -587,32 +693,18 @@ def extract_education(text: str) -> List[Dict[str, str]]:
     
     return education[:3]  # Limit to 3 education entries
 
-def extract_projects(text: str) -> List[Dict[str, Any]]:
-    """Extract projects section"""
-    projects_section = ""
-    lines = text.split('\n')
-    in_projects = False
-    
-    for line in lines:
-        line_upper = line.strip().upper()
-        if 'PROJECTS' in line_upper:
-            in_projects = True
-            continue
-        elif in_projects and line_upper and line_upper.isupper() and len(line_upper) > 3:
-            break
-        elif in_projects:
-            projects_section += line + "\n"
-    
-    if not projects_section.strip():
+def extract_projects(projects_lines: List[str]) -> List[Dict[str, Any]]:
+    """Extract projects from the projects section lines"""
+    if not any(line.strip() for line in projects_lines):
         return []
     
     projects = []
     
     # Look for project entries
-    for line in projects_section.split('\n'):
+    for line in projects_lines:
         line = line.strip()
-        if line.startswith(('•', '-', '*')) or (line and len(line) > 10):
-            clean_line = line.lstrip('•-* ').strip()
+        if line.startswith(_BULLET_PREFIXES) or (line and len(line) > 10):
+            clean_line = line.lstrip(_BULLET_CHARS).lstrip()
             if len(clean_line) > 10:
                 # Extract project name (usually before - or :)
                 if ' - ' in clean_line:
@@ -722,6 +814,33 @@ def test_api_error_handling():
         
         print()
 
+def test_enrich_with_stub_nlp():
+    """Test that enrich() applies NER entities only when asked to"""
+    from types import SimpleNamespace
+    from unittest.mock import patch
+    
+    text = "Senior Engineer at Acme\njane@example.com\nBased in Berlin"
+    entities = [
+        SimpleNamespace(text="Jane Doe", label_="PERSON"),
+        SimpleNamespace(text="Berlin", label_="GPE")
+    ]
+    
+    def stub_nlp(doc):
+        return SimpleNamespace(ents=entities)
+    
+    with patch(f"{__name__}._load_spacy_model", return_value=stub_nlp):
+        regex_only = simulate_openai_conversion(text)
+        enriched = simulate_openai_conversion(text, use_spacy=True)
+    
+    assert regex_only["personal"]["name"] == "Senior Engineer at Acme"
+    assert enriched["personal"]["name"] == "Jane Doe"
+    assert enriched["personal"]["location"] == "Berlin"
+    assert enriched["personal"]["email"] == regex_only["personal"]["email"]
+    
+    # Without spaCy the result is the regex one
+    with patch(f"{__name__}._load_spacy_model", return_value=None):
+        assert simulate_openai_conversion(text, use_spacy=True) == regex_only
+
 if __name__ == "__main__":
     print("🚀 RUNNING COMPREHENSIVE TEXT-TO-JSON TESTS")
     print("=" * 70)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for ScoringService ATS scoring
+"""
+
+import pytest
+
+from services.scoring_service import ScoringContext, ScoringService
+
+
+@pytest.fixture
+def resumes():
+    """Resumes spanning full, partial and empty structure"""
+    return [
+        {
+            'personal': {'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '555-0100'},
+            'summary': {'headline': 'Senior Python Engineer', 'bullets': ['Built AWS data pipelines']},
+            'experience': [{
+                'title': 'Backend Engineer',
+                'company': 'Acme',
+                'achievements': [
+                    {'text': 'Cut API latency with Redis caching', 'keywords': ['redis']},
+                    {'text': 'Migrated services to Kubernetes'}
+                ]
+            }],
+            'skills': {'languages': {'expert': ['Python', 'SQL']}, 'tools': ['Docker']},
+            'education': [{'degree': 'BSc Computer Science', 'school': 'State University'}],
+            'projects': [{'name': 'pipeline-kit', 'keywords': ['airflow']}]
+        },
+        {
+            'personal': {'name': 'John Roe', 'location': 'Remote'},
+            'experience': [{'title': 'JavaScript Developer', 'achievements': []}]
+        },
+        {}
+    ]
+
+
+KEYWORDS = ['Python', 'AWS', 'Redis', 'Kubernetes', 'Java', 'Airflow', 'Go']
+
+
+class TestScoringContext:
+    """Prepared contexts score exactly like raw resume data"""
+
+    def test_prepared_context_matches_raw_data(self, resumes):
+        for resume in resumes:
+            context = ScoringService.prepare_resume(resume)
+
+            assert isinstance(context, ScoringContext)
+            assert (ScoringService.calculate_ats_score(context, KEYWORDS)
+                    == ScoringService.calculate_ats_score(resume, KEYWORDS))
+
+    def test_context_reused_across_job_descriptions(self, resumes):
+        context = ScoringService.prepare_resume(resumes[0])
+
+        for keywords in ([], KEYWORDS, ['python'], ['COBOL']):
+            assert (ScoringService.calculate_ats_score(context, keywords)
+                    == ScoringService.calculate_ats_score(resumes[0], keywords))
+
+    def test_keywords_match_as_substrings(self, resumes):
+        # "java" only appears inside "javascript" and still counts
+        with_java = ScoringService.calculate_ats_score(resumes[1], ['java'])
+        without = ScoringService.calculate_ats_score(resumes[1], [])
+
+        assert with_java == without + 2
+
+
+class TestBatchScoring:
+    """Batch scoring agrees with scoring each resume on its own"""
+
+    def test_batch_matches_single_calls(self, resumes):
+        expected = [ScoringService.calculate_ats_score(r, KEYWORDS) for r in resumes]
+
+        assert ScoringService.calculate_ats_scores_batch(resumes, KEYWORDS) == expected
+
+    def test_batch_accepts_prepared_contexts(self, resumes):
+        mixed = [ScoringService.prepare_resume(resumes[0])] + resumes[1:]
+        expected = [ScoringService.calculate_ats_score(r, KEYWORDS) for r in resumes]
+
+        assert ScoringService.calculate_ats_scores_batch(mixed, KEYWORDS) == expected
+
+    def test_empty_batch(self):
+        assert ScoringService.calculate_ats_scores_batch([], KEYWORDS) == []
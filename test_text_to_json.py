@@ -11,7 +11,9 @@ Tests the complete text-to-JSON conversion pipeline including:
 
 import json
 import os
+import re
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import sys
 
@@ -35,16 +37,20 @@ except ImportError:
     FLASK_AVAILABLE = False
     print("⚠️  Flask not available - skipping Flask tests")
 
+def openai_response(content: str) -> SimpleNamespace:
+    """Build a minimal chat completion response carrying the given content"""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
 class TestTextToJSONConversion:
     """Test suite for text-to-JSON resume conversion feature"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def app(self):
         """Create Flask test app"""
         flask_app.config['TESTING'] = True
         return flask_app
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self, app):
         """Create Flask test client"""
         return app.test_client()
@@ -89,7 +95,7 @@ PROJECTS
 • Payment Gateway API - Developed secure payment processing for e-commerce platform
         """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def expected_json_structure(self):
         """Expected JSON structure after conversion"""
         return {
@@ -138,14 +144,15 @@ PROJECTS
             ]
         }
 
+    @pytest.fixture(scope="class")
+    def expected_json_content(self, expected_json_structure):
+        """Expected JSON structure serialized once per class"""
+        return json.dumps(expected_json_structure, indent=2)
+
     @pytest.fixture
-    def mock_openai_response(self, expected_json_structure):
+    def mock_openai_response(self, expected_json_content):
         """Mock OpenAI API response"""
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message = Mock()
-        mock_response.choices[0].message.content = json.dumps(expected_json_structure, indent=2)
-        return mock_response
+        return openai_response(expected_json_content)
 
     def test_parse_resume_endpoint_success(self, client, sample_text_resume, mock_openai_response):
         """Test successful text resume parsing"""
@@ -238,10 +245,7 @@ PROJECTS
             mock_openai_class.return_value = mock_client
             
             # Mock invalid JSON response
-            mock_response = Mock()
-            mock_response.choices = [Mock()]
-            mock_response.choices[0].message = Mock()
-            mock_response.choices[0].message.content = "This is not valid JSON"
+            mock_response = openai_response("This is not valid JSON")
             mock_client.chat.completions.create.return_value = mock_response
             
             with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
@@ -255,17 +259,14 @@ PROJECTS
             assert 'error' in data
             assert 'Failed to parse AI response as JSON' in data['error']
 
-    def test_parse_resume_with_markdown_cleanup(self, client, sample_text_resume, expected_json_structure):
+    def test_parse_resume_with_markdown_cleanup(self, client, sample_text_resume, expected_json_content):
         """Test JSON cleanup from markdown formatting"""
         with patch('app.OpenAI') as mock_openai_class:
             mock_client = Mock()
             mock_openai_class.return_value = mock_client
             
             # Mock response with markdown formatting
-            mock_response = Mock()
-            mock_response.choices = [Mock()]
-            mock_response.choices[0].message = Mock()
-            mock_response.choices[0].message.content = f"```json\n{json.dumps(expected_json_structure)}\n```"
+            mock_response = openai_response(f"```json\n{expected_json_content}\n```")
             mock_client.chat.completions.create.return_value = mock_response
             
             with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
@@ -332,6 +333,79 @@ PROJECTS
             assert 'validation' in data
             assert data['validation']['valid'] is True
 
+class TestParseResumeCache:
+    """Test caching of AI responses for repeated parse requests"""
+
+    RESUME = "Jane Doe\njane@example.com\n\nEXPERIENCE\nEngineer | Acme | 2020-Present"
+
+    @pytest.fixture
+    def client(self):
+        """Create Flask test client with an empty response cache"""
+        import app as app_module
+        app_module._parse_resume_via_openai.cache_clear()
+        flask_app.config['TESTING'] = True
+        yield flask_app.test_client()
+        app_module._parse_resume_via_openai.cache_clear()
+
+    @pytest.fixture
+    def ai(self):
+        """Patch app.OpenAI so each API key gets its own mock client"""
+        ai = SimpleNamespace(clients={}, content='{"personal": {"name": "Jane Doe"}}')
+
+        def make_client(api_key):
+            mock_client = Mock()
+            mock_client.chat.completions.create.side_effect = lambda **kwargs: openai_response(ai.content)
+            ai.clients[api_key] = mock_client
+            return mock_client
+
+        with patch('app.OpenAI', side_effect=make_client):
+            yield ai
+
+    def post_resume(self, client, api_key='test-key', model='gpt-4o-mini'):
+        with patch.dict(os.environ, {'OPENAI_API_KEY': api_key, 'OPENAI_MODEL': model}):
+            return client.post('/api/parse-resume', json={'textResume': self.RESUME})
+
+    def test_repeat_request_hits_cache(self, client, ai):
+        first = self.post_resume(client)
+        second = self.post_resume(client)
+
+        assert first.status_code == second.status_code == 200
+        assert first.get_json()['resumeData'] == second.get_json()['resumeData']
+        assert ai.clients['test-key'].chat.completions.create.call_count == 1
+
+    def test_invalid_json_is_not_cached(self, client, ai):
+        ai.content = "This is not valid JSON"
+        assert self.post_resume(client).status_code == 500
+
+        ai.content = '{"personal": {"name": "Jane Doe"}}'
+        response = self.post_resume(client)
+
+        assert response.status_code == 200
+        assert response.get_json()['resumeData']['personal']['name'] == 'Jane Doe'
+        assert ai.clients['test-key'].chat.completions.create.call_count == 2
+
+    def test_different_key_or_model_misses_cache(self, client, ai):
+        self.post_resume(client)
+        self.post_resume(client, api_key='other-key')
+        self.post_resume(client, model='gpt-4o')
+
+        assert ai.clients['test-key'].chat.completions.create.call_count == 2
+        assert ai.clients['other-key'].chat.completions.create.call_count == 1
+
+class TestJSONProvider:
+    """Test the app's JSON provider matches stdlib serialization"""
+
+    def test_large_integers_serialize(self):
+        """Integers beyond 64 bits fall back to the stdlib encoder"""
+        value = {"value": 2 ** 70, "small": 1}
+
+        assert json.loads(flask_app.json.dumps(value)) == value
+
+    def test_unserializable_still_raises(self):
+        """Objects neither encoder handles raise TypeError as before"""
+        with pytest.raises(TypeError):
+            flask_app.json.dumps({"value": object()})
+
 class TestPromptEngineering:
     """Test the OpenAI prompt engineering for resume parsing"""
 
@@ -432,6 +506,13 @@ def run_mock_api_tests():
             print(f"   - Found {len(mock_result.get('skills', {}).keys())} skill categories")
             print(f"   - Contact info: {mock_result.get('personal', {}).get('name', 'N/A')}")
 
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Phone and location only try to match at the start of a character run; a
+# later start in the same run can only re-scan it (quadratic without commas).
+_PHONE_RE = re.compile(r'(?<![\(\)0-9\-\+\s])[\(\)0-9\-\+\s]{10,}')
+# City, State pattern
+_LOCATION_RE = re.compile(r'(?<![A-Za-z\s])[A-Za-z\s]+,\s*[A-Z]{2}')
+
 def simulate_text_to_json_conversion(text_resume: str) -> dict:
     """Simulate the text-to-JSON conversion process"""
     
@@ -463,60 +544,58 @@ def extract_name_from_text(text: str) -> str:
 
 def extract_email_from_text(text: str) -> str:
     """Extract email from resume text"""
-    import re
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
     return match.group() if match else ""
 
 def extract_phone_from_text(text: str) -> str:
     """Extract phone from resume text"""
-    import re
-    phone_pattern = r'[\(\)0-9\-\+\s]{10,}'
-    match = re.search(phone_pattern, text)
+    match = _PHONE_RE.search(text)
     return match.group().strip() if match else ""
 
 def extract_location_from_text(text: str) -> str:
     """Extract location from resume text"""
-    import re
-    # Look for City, State pattern
-    location_pattern = r'[A-Za-z\s]+,\s*[A-Z]{2}'
-    match = re.search(location_pattern, text)
+    match = _LOCATION_RE.search(text)
     return match.group() if match else ""
 
+def _section_lines(text: str, marker: str) -> list:
+    """Collect the lines after a marker line, up to the next all-caps line"""
+    if marker not in text.upper():
+        return []
+    
+    section = []
+    in_section = False
+    for line in text.split('\n'):
+        if marker in line.upper():
+            in_section = True
+        elif in_section:
+            if line.strip().isupper():
+                break
+            section.append(line)
+    return section
+
 def extract_experience_from_text(text: str) -> list:
     """Extract experience from resume text"""
-    experience_section = ""
-    lines = text.split('\n')
-    in_experience = False
-    
-    for line in lines:
-        if "EXPERIENCE" in line.upper():
-            in_experience = True
-            continue
-        elif line.strip().isupper() and len(line.strip()) > 0 and in_experience:
-            break
-        elif in_experience:
-            experience_section += line + "\n"
+    experience_lines = _section_lines(text, "EXPERIENCE")
     
     # Mock job extraction
     jobs = []
-    if "|" in experience_section:  # Assume format: Title | Company | Date
-        job_lines = [line for line in experience_section.split('\n') if '|' in line]
-        for job_line in job_lines[:2]:  # Limit to 2 jobs for testing
-            parts = job_line.split('|')
-            if len(parts) >= 2:
-                jobs.append({
-                    "title": parts[0].strip(),
-                    "company": parts[1].strip(),
-                    "duration": parts[2].strip() if len(parts) > 2 else "Unknown",
-                    "achievements": [
-                        {
-                            "text": "Mock achievement extracted from text",
-                            "keywords": ["python", "engineering"],
-                            "metrics": {"value": 1000000, "type": "users"}
-                        }
-                    ]
-                })
+    # Assume format: Title | Company | Date
+    job_lines = [line for line in experience_lines if '|' in line]
+    for job_line in job_lines[:2]:  # Limit to 2 jobs for testing
+        parts = job_line.split('|')
+        if len(parts) >= 2:
+            jobs.append({
+                "title": parts[0].strip(),
+                "company": parts[1].strip(),
+                "duration": parts[2].strip() if len(parts) > 2 else "Unknown",
+                "achievements": [
+                    {
+                        "text": "Mock achievement extracted from text",
+                        "keywords": ["python", "engineering"],
+                        "metrics": {"value": 1000000, "type": "users"}
+                    }
+                ]
+            })
     
     return jobs
 
@@ -524,29 +603,13 @@ def extract_skills_from_text(text: str) -> dict:
     """Extract skills from resume text"""
     skills = {}
     
-    # Look for skills section
-    if "SKILLS" in text.upper():
-        skills_section = ""
-        lines = text.split('\n')
-        in_skills = False
-        
-        for line in lines:
-            if "SKILLS" in line.upper():
-                in_skills = True
-                continue
-            elif line.strip().isupper() and len(line.strip()) > 0 and in_skills:
-                break
-            elif in_skills:
-                skills_section += line + "\n"
-        
-        # Parse skills by category
-        if ":" in skills_section:
-            for line in skills_section.split('\n'):
-                if ":" in line:
-                    category, skill_list = line.split(':', 1)
-                    category_key = category.strip().lower().replace(' ', '_')
-                    skills_list = [s.strip() for s in skill_list.split(',')]
-                    skills[category_key] = {"proficient": skills_list}
+    # Parse skills by category
+    for line in _section_lines(text, "SKILLS"):
+        if ":" in line:
+            category, skill_list = line.split(':', 1)
+            category_key = category.strip().lower().replace(' ', '_')
+            skills_list = [s.strip() for s in skill_list.split(',')]
+            skills[category_key] = {"proficient": skills_list}
     
     return skills
 
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for JobDescriptionValidator result caching
+"""
+
+import pytest
+
+from validation.validators import JobDescriptionValidator
+
+
+JOB_DESCRIPTION = (
+    "Senior Python Engineer. Responsibilities include building APIs. "
+    "Requirements: 5 years of experience with Python and AWS."
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish each test with an empty analysis cache"""
+    JobDescriptionValidator._analyze.cache_clear()
+    yield
+    JobDescriptionValidator._analyze.cache_clear()
+
+
+class TestJobDescriptionCache:
+    """Repeated job descriptions reuse the cached analysis"""
+
+    def test_repeat_validation_hits_cache(self):
+        first = JobDescriptionValidator.validate(JOB_DESCRIPTION)
+        second = JobDescriptionValidator.validate(JOB_DESCRIPTION)
+
+        assert first == second
+        assert JobDescriptionValidator._analyze.cache_info().hits == 1
+
+    def test_responses_do_not_share_warnings(self):
+        first = JobDescriptionValidator.validate(JOB_DESCRIPTION)
+        first['warnings'].append('mutated')
+
+        assert 'mutated' not in JobDescriptionValidator.validate(JOB_DESCRIPTION)['warnings']
+
+    def test_oversized_input_bypasses_cache(self):
+        oversized = JOB_DESCRIPTION + ' word' * JobDescriptionValidator.MAX_CACHED_LENGTH
+
+        result = JobDescriptionValidator.validate(oversized)
+
+        assert JobDescriptionValidator._analyze.cache_info().currsize == 0
+        assert result['word_count'] == len(oversized.split())
+        assert any('very long' in warning for warning in result['warnings'])
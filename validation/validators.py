@@ -3,12 +3,52 @@ Validators - Input validation for resumes and job descriptions
 """
 
 import re
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+# Sentinel for dict.get, so a key holding None still counts as present
+_MISSING = object()
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Job fields reported when missing or empty, in report order
+_RECOMMENDED_JOB_FIELDS = ('title', 'company', 'duration')
+
+# Recommendations attached to every valid resume
+_RESUME_RECOMMENDATIONS = (
+    'Include quantifiable achievements with metrics (e.g., "$100M TVL", "20+ engineers")',
+    'Add relevant keywords to each achievement for better ATS matching',
+    'Organize skills by proficiency level (expert, proficient, familiar)',
+    'Include education section for complete professional profile'
+)
+
+# Job description terms, already lowercase for matching lowercased text
+_JD_SECTION_TERMS = (
+    'requirements', 'responsibilities', 'qualifications',
+    'skills', 'experience'
+)
+_JD_INDICATOR_TERMS = (
+    'years', 'experience', 'required', 'preferred',
+    'must have', 'should have'
+)
+
+
+def _count_terms(text: str, terms: Tuple[str, ...], limit: int) -> int:
+    """Count terms that occur in text, stopping once limit is reached"""
+    found = 0
+    for term in terms:
+        if term in text:
+            found += 1
+            if found >= limit:
+                break
+    return found
 
 
 class ValidationResult:
     """Container for validation results"""
 
+    __slots__ = ('errors', 'warnings', 'recommendations')
+
     def __init__(self):
         self.errors: List[str] = []
         self.warnings: List[str] = []
@@ -21,11 +61,12 @@ class ValidationResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses"""
+        valid = self.is_valid
         return {
-            'valid': self.is_valid,
+            'valid': valid,
             'errors': self.errors,
             'warnings': self.warnings,
-            'recommendations': self.recommendations if self.is_valid else []
+            'recommendations': self.recommendations if valid else []
         }
 
 
@@ -55,12 +96,7 @@ class ResumeValidator:
         ResumeValidator._validate_summary_section(resume_data, result)
 
         if result.is_valid:
-            result.recommendations = [
-                'Include quantifiable achievements with metrics (e.g., "$100M TVL", "20+ engineers")',
-                'Add relevant keywords to each achievement for better ATS matching',
-                'Organize skills by proficiency level (expert, proficient, familiar)',
-                'Include education section for complete professional profile'
-            ]
+            result.recommendations = list(_RESUME_RECOMMENDATIONS)
 
         return result
 
@@ -70,11 +106,11 @@ class ResumeValidator:
         result: ValidationResult
     ) -> None:
         """Validate personal information section"""
-        if 'personal' not in resume_data:
+        personal = resume_data.get('personal', _MISSING)
+        if personal is _MISSING:
             result.errors.append('Missing required "personal" section')
             return
 
-        personal = resume_data['personal']
         required_fields = ['name', 'email']
 
         for field in required_fields:
@@ -83,8 +119,7 @@ class ResumeValidator:
 
         # Email validation
         if 'email' in personal and personal['email']:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, personal['email']):
+            if not _EMAIL_RE.match(personal['email']):
                 result.errors.append('Invalid email format in personal.email')
 
     @staticmethod
@@ -93,54 +128,53 @@ class ResumeValidator:
         result: ValidationResult
     ) -> None:
         """Validate experience section"""
-        if 'experience' not in resume_data:
+        experience = resume_data.get('experience', _MISSING)
+        if experience is _MISSING:
             result.warnings.append(
                 'Missing "experience" section - recommended for ATS optimization'
             )
             return
 
-        experience = resume_data['experience']
-
         if not isinstance(experience, list):
             result.errors.append('"experience" must be an array of job objects')
             return
 
-        for i, job in enumerate(experience):
+        for number, job in enumerate(experience, 1):
             if not isinstance(job, dict):
-                result.errors.append(f'Experience item {i+1} must be an object')
+                result.errors.append(f'Experience item {number} must be an object')
                 continue
 
-            required_job_fields = ['title', 'company', 'duration']
-            for field in required_job_fields:
-                if field not in job or not job[field]:
+            for field in _RECOMMENDED_JOB_FIELDS:
+                if not job.get(field):
                     result.warnings.append(
-                        f'Experience item {i+1} missing recommended field: {field}'
+                        f'Experience item {number} missing recommended field: {field}'
                     )
 
-            if 'achievements' in job:
+            achievements = job.get('achievements', _MISSING)
+            if achievements is not _MISSING:
                 ResumeValidator._validate_achievements(
-                    job['achievements'],
-                    i,
+                    achievements,
+                    number,
                     result
                 )
 
     @staticmethod
     def _validate_achievements(
         achievements: Any,
-        job_index: int,
+        job_number: int,
         result: ValidationResult
     ) -> None:
-        """Validate achievements array"""
+        """Validate achievements array for the 1-based job_number"""
         if not isinstance(achievements, list):
             result.errors.append(
-                f'Experience item {job_index+1} achievements must be an array'
+                f'Experience item {job_number} achievements must be an array'
             )
             return
 
-        for j, achievement in enumerate(achievements):
+        for number, achievement in enumerate(achievements, 1):
             if not isinstance(achievement, dict) or 'text' not in achievement:
                 result.errors.append(
-                    f'Achievement {j+1} in job {job_index+1} must have "text" field'
+                    f'Achievement {number} in job {job_number} must have "text" field'
                 )
 
     @staticmethod
@@ -160,13 +194,13 @@ class ResumeValidator:
         result: ValidationResult
     ) -> None:
         """Validate summary section"""
-        if 'summary' not in resume_data:
+        summary = resume_data.get('summary', _MISSING)
+        if summary is _MISSING:
             result.warnings.append(
                 'Missing "summary" section - helps with ATS optimization'
             )
             return
 
-        summary = resume_data['summary']
         if 'headline' not in summary or not summary['headline']:
             result.warnings.append(
                 'Missing summary headline - recommended for professional impact'
@@ -178,6 +212,10 @@ class JobDescriptionValidator:
 
     MIN_WORD_COUNT = 50
     MAX_WORD_COUNT = 2000
+    MIN_TERM_MATCHES = 2
+
+    # Longer texts are validated without being held in the cache
+    MAX_CACHED_LENGTH = 64_000
 
     @staticmethod
     def validate(job_description: str) -> Dict[str, Any]:
@@ -196,54 +234,65 @@ class JobDescriptionValidator:
             result.errors.append('Job description cannot be empty')
             return result.to_dict()
 
+        analyze = JobDescriptionValidator._analyze
+        if len(job_description) > JobDescriptionValidator.MAX_CACHED_LENGTH:
+            analyze = analyze.__wrapped__
+        warnings, word_count = analyze(job_description)
+        result.warnings.extend(warnings)
+
+        response = result.to_dict()
+        response['word_count'] = word_count
+        response['estimated_keywords'] = min(60, word_count // 10)
+
+        return response
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _analyze(job_description: str) -> Tuple[Tuple[str, ...], int]:
+        """
+        Return the warnings and word count for a non-empty job description
+
+        Cached so resubmitting the same text skips the scans; the result is
+        immutable and validate() copies it into a fresh response.
+        """
+        warnings = []
         word_count = len(job_description.split())
 
         # Length validation
         if word_count < JobDescriptionValidator.MIN_WORD_COUNT:
-            result.warnings.append(
+            warnings.append(
                 f'Job description is quite short ({word_count} words). '
                 'Longer descriptions provide better optimization.'
             )
         elif word_count > JobDescriptionValidator.MAX_WORD_COUNT:
-            result.warnings.append(
+            warnings.append(
                 f'Job description is very long ({word_count} words). '
                 'Consider focusing on key requirements.'
             )
 
-        # Content validation
-        common_sections = [
-            'requirements', 'responsibilities', 'qualifications',
-            'skills', 'experience'
-        ]
-        found_sections = sum(
-            1 for section in common_sections
-            if section.lower() in job_description.lower()
+        # Content validation; lowercase once for every term check below
+        description_lower = job_description.lower()
+        found_sections = _count_terms(
+            description_lower, _JD_SECTION_TERMS,
+            JobDescriptionValidator.MIN_TERM_MATCHES
         )
 
-        if found_sections < 2:
-            result.warnings.append(
+        if found_sections < JobDescriptionValidator.MIN_TERM_MATCHES:
+            warnings.append(
                 'Job description may be missing key sections '
                 '(requirements, responsibilities, qualifications)'
             )
 
         # Technical terms check
-        technical_indicators = [
-            'years', 'experience', 'required', 'preferred',
-            'must have', 'should have'
-        ]
-        found_indicators = sum(
-            1 for indicator in technical_indicators
-            if indicator.lower() in job_description.lower()
+        found_indicators = _count_terms(
+            description_lower, _JD_INDICATOR_TERMS,
+            JobDescriptionValidator.MIN_TERM_MATCHES
         )
 
-        if found_indicators < 2:
-            result.warnings.append(
+        if found_indicators < JobDescriptionValidator.MIN_TERM_MATCHES:
+            warnings.append(
                 'Job description may lack specific requirements '
                 'for better keyword extraction'
             )
 
-        response = result.to_dict()
-        response['word_count'] = word_count
-        response['estimated_keywords'] = min(60, word_count // 10)
-
-        return response
+        return tuple(warnings), word_count